@@ -9,34 +9,53 @@ registered via os.add_dll_directory() so that the _tds extension can find them.
 This file should be placed in the project root (next to setup.py) or in the
 tests/ directory.
 """
+import functools
 import os
 import platform
 import sys
 
+# Cookies returned by os.add_dll_directory(), retained so the
+# registrations stay alive and tests can deregister via cookie.close().
+_dll_directory_cookies = []
 
-def _register_freetds_dll_directory():
-    """Register the FreeTDS DLL directory on Windows (Python 3.8+)."""
-    if platform.system() != 'Windows':
-        return
-
-    if not hasattr(os, 'add_dll_directory'):
-        # Python < 3.8 doesn't need this; PATH is still searched.
-        return
 
+@functools.lru_cache(maxsize=None)
+def _resolve_freetds_dll_dirs():
+    """Resolve candidate FreeTDS DLL directories from the environment."""
     # Check BUILD_INSTALL_PREFIX (set in appveyor.yml / build_script.ps1).
     dll_dir = os.environ.get('BUILD_INSTALL_PREFIX')
     if dll_dir:
         lib_dir = os.path.join(dll_dir, 'lib')
         if os.path.isdir(lib_dir):
-            os.add_dll_directory(lib_dir)
-            return
+            return (lib_dir,)
 
     # Fallback: check CTDS_LIBRARY_DIRS (set during pip install).
     lib_dirs = os.environ.get('CTDS_LIBRARY_DIRS')
     if lib_dirs:
-        for d in lib_dirs.split(os.pathsep):
-            if os.path.isdir(d):
-                os.add_dll_directory(d)
+        return tuple(d for d in lib_dirs.split(os.pathsep) if os.path.isdir(d))
+
+    return ()
+
+
+def _register_freetds_dll_directory():
+    """
+    Register the FreeTDS DLL directories on Windows (Python 3.8+).
+
+    Idempotent: re-entry (e.g. conftest.py loaded more than once) does not
+    issue duplicate AddDllDirectory calls.
+    """
+    if _dll_directory_cookies:
+        return
+
+    if platform.system() != 'Windows':
+        return
+
+    if not hasattr(os, 'add_dll_directory'):
+        # Python < 3.8 doesn't need this; PATH is still searched.
+        return
+
+    for lib_dir in _resolve_freetds_dll_dirs():
+        _dll_directory_cookies.append(os.add_dll_directory(lib_dir))
 
 
 _register_freetds_dll_directory()
@@ -3,6 +3,42 @@
 specification for Microsoft SQL Server.
 '''
 import logging
+import os
+import platform
+
+
+def _register_freetds_dll_directories():
+    '''
+    Register the FreeTDS DLL directories on Windows (Python 3.8+).
+
+    As of Python 3.8, PATH is no longer searched when resolving extension
+    module DLL dependencies, so the directory containing the FreeTDS DLLs
+    (ct.dll, sybdb.dll) must be registered before the `_tds` extension is
+    imported below.
+    '''
+    if platform.system() != 'Windows':
+        return
+
+    if not hasattr(os, 'add_dll_directory'):
+        # Python < 3.8 doesn't need this; PATH is still searched.
+        return
+
+    candidates = []
+    prefix = os.environ.get('BUILD_INSTALL_PREFIX')
+    if prefix:
+        candidates.append(os.path.join(prefix, 'lib'))
+    lib_dirs = os.environ.get('CTDS_LIBRARY_DIRS')
+    if lib_dirs:
+        candidates.extend(lib_dirs.split(os.pathsep))
+
+    for lib_dir in candidates:
+        if os.path.isdir(lib_dir):
+            os.add_dll_directory(lib_dir)
+
+
+_register_freetds_dll_directories()
+
+del _register_freetds_dll_directories
 
 # pylint: disable=no-name-in-module,redefined-builtin
 from k_ctds._tds import (
@@ -85,6 +121,8 @@ from k_ctds._tds import (
     SqlVarChar,
 )
 
+from k_ctds._bulk_insert import bulk_insert_columns
+
 
 class NullHandler(logging.Handler):
     def emit(self, record):
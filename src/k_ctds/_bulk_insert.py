@@ -6,8 +6,44 @@ collation, then encodes Python str values to the correct byte
 representation before passing rows to the C bulk_insert.
 """
 
+import codecs
+from functools import lru_cache
+import re
+from weakref import WeakKeyDictionary
+
 from ._tds import SqlVarChar # pylint: disable=no-name-in-module
 
+try:
+    # C implementation of the row encoding loop. Not present in older
+    # builds of the extension; fall back to the pure-Python generator.
+    from ._tds import encode_rows as _encode_rows_c # pylint: disable=no-name-in-module
+except ImportError: # pragma: nocover
+    _encode_rows_c = None
+
+
+# Cache of resolved column codecs, keyed by connection and then by parsed
+# (catalog, schema, table) name. Entries are discarded automatically when
+# the owning connection is garbage collected.
+_CODEC_CACHE = WeakKeyDictionary()
+
+
+def clear_codec_cache(connection=None):
+    """
+    Discard cached column codec metadata used by `bulk_insert`'s
+    `auto_encode` option.
+
+    `auto_encode` assumes a table's schema is stable for the lifetime of
+    the connection; call this after DDL that changes column types or
+    collations of a bulk insert target table.
+
+    If `connection` is None, cached metadata for all connections is
+    discarded; otherwise only that connection's metadata is discarded.
+    """
+    if connection is None:
+        _CODEC_CACHE.clear()
+    else:
+        _CODEC_CACHE.pop(connection, None)
+
 
 # SQL Server collation code page -> Python codec name.
 _CODEPAGE_TO_CODEC = {
@@ -31,6 +67,36 @@ _CODEPAGE_TO_CODEC = {
 }
 
 
+# Tokenizer for multi-part table names. Each alternation matches one of:
+# a [bracketed] identifier (closing bracket optional at end of input), a
+# "quoted" identifier with "" escapes (closing quote optional), a run of
+# plain characters, or the '.' part separator.
+_TOKEN_RE = re.compile(r'(\[[^\]]*\]?)|("(?:[^"]|"")*"?)|([^.["]+)|(\.)')
+
+
+# Low-level encoders pre-resolved at import for every codec this module
+# can emit ('utf-16-le' plus the collation code pages above), so building
+# a per-column encoder costs a dict hit instead of a codec-registry
+# lookup.
+_CODEC_ENCODE = {
+    name: codecs.lookup(name).encode
+    for name in list(_CODEPAGE_TO_CODEC.values()) + ['utf-16-le']
+}
+
+
+# DATA_TYPE -> column kind: 1 for national (UTF-16LE) text types, 2 for
+# code-page text types. Anything else needs no encoding.
+_TYPE_KIND = {
+    'nvarchar': 1,
+    'nchar': 1,
+    'ntext': 1,
+    'varchar': 2,
+    'char': 2,
+    'text': 2,
+}
+
+
+@lru_cache(maxsize=256)
 def _parse_table_name(table):
     """
     Parse a possibly multi-part SQL Server table name into
@@ -46,44 +112,35 @@ def _parse_table_name(table):
         ValueError: If the table name has more than 3 parts.
     """
     parts = []
-    current = []
-    i = 0
-
-    while i < len(table):
-        ch = table[i]
-
-        if ch == '[':
-            i += 1
-            while i < len(table) and table[i] != ']':
-                current.append(table[i])
-                i += 1
-            if i < len(table):
-                i += 1  # skip closing ]
-
-        elif ch == '"':
-            i += 1
-            while i < len(table):
-                if table[i] == '"':
-                    if i + 1 < len(table) and table[i + 1] == '"':
-                        current.append('"')
-                        i += 2
-                    else:
-                        i += 1
-                        break
-                else:
-                    current.append(table[i])
-                    i += 1
-
-        elif ch == '.':
-            parts.append(''.join(current))
-            current = []
-            i += 1
+    current = ''
+
+    for match in _TOKEN_RE.finditer(table):
+        index = match.lastindex
+
+        if index == 1:
+            # [bracketed]: strip the delimiters.
+            token = match.group(1)
+            current += token[1:-1] if token.endswith(']') else token[1:]
+
+        elif index == 2:
+            # "quoted": strip the delimiters, unescape "" pairs. An odd
+            # number of trailing quotes means the last one closes the
+            # identifier; an even number is a run of escaped pairs in an
+            # unterminated identifier.
+            body = match.group(2)[1:]
+            if (len(body) - len(body.rstrip('"'))) % 2:
+                body = body[:-1]
+            current += body.replace('""', '"')
+
+        elif index == 3:
+            current += match.group(3)
 
         else:
-            current.append(ch)
-            i += 1
+            # Separator: flush the accumulated part.
+            parts.append(current)
+            current = ''
 
-    parts.append(''.join(current))
+    parts.append(current)
 
     if len(parts) == 1:
         return (None, None, parts[0])
@@ -98,6 +155,47 @@ def _parse_table_name(table):
         )
 
 
+# Prebuilt column metadata queries, keyed by (has_schema, has_catalog).
+# The WHERE clause is fixed per shape; only the catalog-qualified variants
+# still need the INFORMATION_SCHEMA prefix interpolated per call, since it
+# embeds the catalog name itself.
+_COLUMN_QUERY_TEMPLATE = (
+    'SELECT COLUMN_NAME, DATA_TYPE, '
+    "CAST(COLLATIONPROPERTY(COLLATION_NAME, 'CodePage') AS INT) AS CodePage "
+    'FROM {} WHERE {} '
+    'ORDER BY ORDINAL_POSITION'
+)
+_COLUMN_QUERIES = {
+    (False, False): _COLUMN_QUERY_TEMPLATE.format(
+        'INFORMATION_SCHEMA.COLUMNS', 'TABLE_NAME = :0'
+    ),
+    (True, False): _COLUMN_QUERY_TEMPLATE.format(
+        'INFORMATION_SCHEMA.COLUMNS', 'TABLE_NAME = :0 AND TABLE_SCHEMA = :1'
+    ),
+    (True, True): _COLUMN_QUERY_TEMPLATE.format(
+        '{}', 'TABLE_NAME = :0 AND TABLE_SCHEMA = :1 AND TABLE_CATALOG = :2'
+    ),
+    (False, True): _COLUMN_QUERY_TEMPLATE.format(
+        '{}', 'TABLE_NAME = :0 AND TABLE_CATALOG = :1'
+    ),
+}
+
+
+def _execute_fetchall(connection, query, params):
+    """
+    Execute a one-shot query and return all rows.
+
+    Skips the cursor context-manager protocol (two extra Python-level
+    calls) on the metadata path; the cursor is closed explicitly.
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(query, params)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
 def _get_column_codecs(connection, table):
     """
     Query INFORMATION_SCHEMA.COLUMNS to build an ordered list of codecs
@@ -110,56 +208,56 @@ def _get_column_codecs(connection, table):
             VARCHAR/CHAR/TEXT    -> collation codec (e.g. 'cp1252')
             everything else     -> None
         by_name: dict of column_name -> codec_or_None (same values)
+
+    Results are cached per (connection, parsed table name) so repeated
+    bulk_insert calls against the same table skip the metadata query.
+    Use `clear_codec_cache` to invalidate after DDL changes.
     """
     catalog, schema, table_name = _parse_table_name(table)
 
-    if catalog:
-        info_schema = '[{}].INFORMATION_SCHEMA.COLUMNS'.format(
-            catalog.replace(']', ']]')
-        )
-    else:
-        info_schema = 'INFORMATION_SCHEMA.COLUMNS'
-
-    params = [table_name]
-    where_clauses = ['TABLE_NAME = :0']
-
-    if schema is not None:
-        params.append(schema)
-        where_clauses.append('TABLE_SCHEMA = :1')
+    cache = _CODEC_CACHE.setdefault(connection, {})
+    cache_key = (catalog, schema, table_name)
+    if cache_key in cache:
+        return cache[cache_key]
 
+    # Build the parameter tuple and pick the prebuilt query directly from
+    # the name shape.
     if catalog is not None:
-        params.append(catalog)
-        where_clauses.append('TABLE_CATALOG = :{}'.format(len(params) - 1))
-
-    query = (
-        'SELECT COLUMN_NAME, DATA_TYPE, '
-        "CAST(COLLATIONPROPERTY(COLLATION_NAME, 'CodePage') AS INT) AS CodePage " 
-        'FROM {} WHERE {} '
-        'ORDER BY ORDINAL_POSITION'.format(
-            info_schema, ' AND '.join(where_clauses)
+        if schema is not None:
+            params = (table_name, schema, catalog)
+            query = _COLUMN_QUERIES[(True, True)]
+        else:
+            params = (table_name, catalog)
+            query = _COLUMN_QUERIES[(False, True)]
+        query = query.format(
+            '[{}].INFORMATION_SCHEMA.COLUMNS'.format(catalog.replace(']', ']]'))
         )
-    )
+    elif schema is not None:
+        params = (table_name, schema)
+        query = _COLUMN_QUERIES[(True, False)]
+    else:
+        params = (table_name,)
+        query = _COLUMN_QUERIES[(False, False)]
 
     by_position = []
     by_name = {}
 
-    with connection.cursor() as cursor:
-        cursor.execute(query, tuple(params))
-        for row in cursor.fetchall():
-            col_name = row[0]
-            data_type = row[1].lower()
-            code_page = row[2]
-
-            # Resolve the codec once here — no need to classify types later.
-            if data_type in ('nvarchar', 'nchar', 'ntext'):
-                codec = 'utf-16-le'
-            elif data_type in ('varchar', 'char', 'text') and code_page is not None:
-                codec = _CODEPAGE_TO_CODEC.get(int(code_page))
-            else:
-                codec = None
+    for row in _execute_fetchall(connection, query, params):
+        col_name = row[0]
+        data_type = row[1].lower()
+        code_page = row[2]
+
+        # Resolve the codec once here — no need to classify types later.
+        kind = _TYPE_KIND.get(data_type, 0)
+        if kind == 1:
+            codec = 'utf-16-le'
+        elif kind == 2 and code_page is not None:
+            codec = _CODEPAGE_TO_CODEC.get(int(code_page))
+        else:
+            codec = None
 
-            by_position.append(codec)
-            by_name[col_name] = codec
+        by_position.append(codec)
+        by_name[col_name] = codec
 
     if not by_position:
         raise ValueError(
@@ -168,12 +266,142 @@ def _get_column_codecs(connection, table):
             'Note: temporary tables are not supported with auto_encode.'.format(table)
         )
 
+    cache[cache_key] = (by_position, by_name)
     return by_position, by_name
 
 
+def _identity(value):
+    return value
+
+
+def _make_encoder(codec):
+    """
+    Build the per-column encoder callable for a codec resolved by
+    `_get_column_codecs`.
+
+    Non-text columns (codec=None) get a pass-through; text columns get a
+    closure with the codec bound, so the per-cell work is a single call
+    with no metadata lookups.
+
+    The SqlVarChar wrapper is a fixed-size C allocation with no
+    per-instance __dict__, so wrapping each encoded cell costs one small
+    object, not a dict-backed Python instance.
+    """
+    if codec is None:
+        return _identity
+
+    # Resolve the codec once, rather than paying the codec-registry lookup
+    # on every str.encode call. The low-level encoder returns a
+    # (bytes, length consumed) pair.
+    encode = _CODEC_ENCODE.get(codec)
+    if encode is None:
+        encode = codecs.lookup(codec).encode
+
+    def _encode(value, _encode=encode, _wrap=SqlVarChar):
+        return _wrap(_encode(value)[0]) if type(value) is str else value
+
+    return _encode
+
+
+def _get_column_codecs_bulk(connection, tables):
+    """
+    Resolve column codecs for multiple tables at once.
+
+    Issues one INFORMATION_SCHEMA.COLUMNS query per distinct
+    (catalog, schema) group instead of one per table, and pre-fills the
+    per-connection codec cache so subsequent `bulk_insert` calls against
+    any of the tables are cache hits.
+
+    Returns:
+        dict: table (as passed in) -> (by_position, by_name), with the
+        same entry structure as `_get_column_codecs`.
+
+    Raises:
+        ValueError: If no columns are found for one of the tables.
+    """
+    cache = _CODEC_CACHE.setdefault(connection, {})
+
+    results = {}
+    parsed = {}
+    groups = {}
+
+    for table in tables:
+        key = _parse_table_name(table)
+        parsed[table] = key
+        if key in cache:
+            results[table] = cache[key]
+        else:
+            groups.setdefault(key[:2], []).append(key[2])
+
+    for (catalog, schema), names in groups.items():
+        if catalog:
+            info_schema = '[{}].INFORMATION_SCHEMA.COLUMNS'.format(
+                catalog.replace(']', ']]')
+            )
+        else:
+            info_schema = 'INFORMATION_SCHEMA.COLUMNS'
+
+        params = list(names)
+        where = 'TABLE_NAME IN ({})'.format(
+            ', '.join(':{}'.format(ix) for ix in range(len(names)))
+        )
+        if schema is not None:
+            where += ' AND TABLE_SCHEMA = :{}'.format(len(params))
+            params.append(schema)
+        if catalog is not None:
+            where += ' AND TABLE_CATALOG = :{}'.format(len(params))
+            params.append(catalog)
+
+        query = (
+            'SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, '
+            "CAST(COLLATIONPROPERTY(COLLATION_NAME, 'CodePage') AS INT) AS CodePage "
+            'FROM {} WHERE {} '
+            'ORDER BY TABLE_NAME, ORDINAL_POSITION'.format(info_schema, where)
+        )
+
+        # Partition the combined result set by table. Keyed
+        # case-insensitively since the server reports the stored name
+        # casing, which may differ from the caller's.
+        found = {}
+
+        for row in _execute_fetchall(connection, query, tuple(params)):
+            by_position, by_name = found.setdefault(row[0].lower(), ([], {}))
+
+            data_type = row[2].lower()
+            code_page = row[3]
+
+            kind = _TYPE_KIND.get(data_type, 0)
+            if kind == 1:
+                codec = 'utf-16-le'
+            elif kind == 2 and code_page is not None:
+                codec = _CODEPAGE_TO_CODEC.get(int(code_page))
+            else:
+                codec = None
+
+            by_position.append(codec)
+            by_name[row[1]] = codec
+
+        for name in names:
+            entry = found.get(name.lower())
+            if entry:
+                cache[(catalog, schema, name)] = entry
+
+    for table, key in parsed.items():
+        if table not in results:
+            if key not in cache:
+                raise ValueError(
+                    'No columns found for table {!r} in INFORMATION_SCHEMA.COLUMNS. '
+                    'Verify the table exists and the current user has access. '
+                    'Note: temporary tables are not supported with auto_encode.'.format(table)
+                )
+            results[table] = cache[key]
+
+    return results
+
+
 def _encode_rows(rows, by_position, by_name):
     """
-    Generator that encodes str values in each row before yielding.
+    Iterator that encodes str values in each row before yielding.
 
     For sequence rows: uses by_position (ordinal index).
     For dict rows: uses by_name (column name lookup).
@@ -183,19 +411,208 @@ def _encode_rows(rows, by_position, by_name):
     for VARCHAR columns it uses the column's collation codec.
     Note: SqlNVarChar also works correctly for NVARCHAR columns as
     Parameter_bcp_bind now re-encodes UTF-8 to UTF-16LE automatically.
+
+    Only str values are encoded: bytes, bytearray and SqlVarChar values
+    are treated as already encoded and pass through unchanged, so
+    callers may pre-encode values themselves and reuse them across
+    inserts.
+
+    Dispatches to the C implementation in the `_tds` extension when
+    available; `_encode_rows_py` is the pure-Python fallback.
+    """
+    if _encode_rows_c is not None:
+        return _encode_rows_c(rows, by_position, by_name, SqlVarChar)
+    return _encode_rows_py(rows, by_position, by_name)
+
+
+def _encode_rows_py(rows, by_position, by_name):
     """
+    Pure-Python implementation of `_encode_rows`.
+
+    Per-column encoder callables are built once up front; the per-row
+    loop just applies them.
+    """
+    # Specialize on the schema up front: only columns with a codec need
+    # any per-row work at all.
+    encoded_cols = [
+        (index, _make_encoder(codec))
+        for index, codec in enumerate(by_position) if codec
+    ]
+    name_encoders = {name: _make_encoder(codec) for name, codec in by_name.items()}
+    # Bind the lookup once; unknown keys (no metadata) pass through.
+    name_encoder_get = name_encoders.get
+
+    if not encoded_cols and not any(by_name.values()):
+        # No text columns anywhere -- pass rows through untouched.
+        for row in rows:
+            yield row
+        return
+
+    if len(encoded_cols) == len(by_position):
+        # Every column is text: pair encoders with values directly via
+        # zip rather than enumerate + indexing.
+        encoders = [encoder for _, encoder in encoded_cols]
+        nencoders = len(encoders)
+        for row in rows:
+            if isinstance(row, dict):
+                yield {
+                    k: name_encoder_get(k, _identity)(v)
+                    for k, v in row.items()
+                }
+            else:
+                row_list = [
+                    encoder(value) for encoder, value in zip(encoders, row)
+                ]
+                if nencoders < len(row):
+                    # More values than metadata columns: pass extras through.
+                    row_list.extend(row[nencoders:])
+                yield row_list
+        return
+
     for row in rows:
         if isinstance(row, dict):
             yield {
-                k: SqlVarChar(v.encode(by_name[k]))
-                   if isinstance(v, str) and by_name.get(k)
-                   else v
+                k: name_encoder_get(k, _identity)(v)
                 for k, v in row.items()
             }
         else:
-            yield tuple(
-                SqlVarChar(v.encode(by_position[i]))
-                   if isinstance(v, str) and i < len(by_position) and by_position[i]
-                   else v
-                for i, v in enumerate(row)
-            )
+            # Overwrite only the columns that need encoding. The C
+            # bulk_insert consumer accepts any sequence, so the list is
+            # yielded directly rather than cast back to a tuple.
+            row_list = list(row)
+            nvalues = len(row_list)
+            for index, encoder in encoded_cols:
+                if index < nvalues:
+                    row_list[index] = encoder(row_list[index])
+            yield row_list
+
+
+# Sentinel used to join a whole text column into a single encode call.
+# U+001F (unit separator) is vanishingly rare in real data; columns
+# containing it fall back to per-cell encoding.
+_COLUMN_SENTINEL = '\x1f'
+
+
+def _split_encoded(joined, sep):
+    """
+    Split encoded bytes on an encoded separator, honouring the encoding's
+    code-unit width.
+
+    For UTF-16LE the separator byte pattern can also occur straddling two
+    adjacent code units; only matches aligned to the code-unit width are
+    real separators.
+    """
+    width = len(sep)
+    if width == 1:
+        return joined.split(sep)
+
+    parts = []
+    start = 0
+    ix = joined.find(sep)
+    while ix != -1:
+        if ix % width:
+            ix = joined.find(sep, ix + 1)
+            continue
+        parts.append(joined[start:ix])
+        start = ix + width
+        ix = joined.find(sep, start)
+    parts.append(joined[start:])
+    return parts
+
+
+def _encode_column(values, codec):
+    """
+    Encode a whole column of values in one pass.
+
+    Columns without a codec are returned unchanged. When every value is a
+    plain str free of the join sentinel, the column is encoded with a
+    single codec call: the values are joined with the sentinel, encoded
+    once and the encoded bytes split back apart. Otherwise (None values,
+    pre-encoded bytes, or a sentinel collision) each value is encoded
+    individually.
+    """
+    if codec is None:
+        return values
+
+    if values and all(
+            type(value) is str and _COLUMN_SENTINEL not in value
+            for value in values
+    ):
+        encode = _CODEC_ENCODE.get(codec)
+        if encode is None:
+            encode = codecs.lookup(codec).encode
+        try:
+            joined = encode(_COLUMN_SENTINEL.join(values))[0]
+        except UnicodeEncodeError:
+            # Fall through to the per-cell loop, which raises with the
+            # offending value's own offsets.
+            pass
+        else:
+            sep = encode(_COLUMN_SENTINEL)[0]
+            return [SqlVarChar(chunk) for chunk in _split_encoded(joined, sep)]
+
+    encode_value = _make_encoder(codec)
+    return [encode_value(value) for value in values]
+
+
+def bulk_insert_columns(connection, table, columns, **kwargs):
+    """
+    Bulk insert column-major data into a table.
+
+    This is a columnar alternative to passing row tuples to
+    `Connection.bulk_insert` with `auto_encode=True`: each text column is
+    encoded in a single pass with its codec resolved once, instead of
+    dispatching on column metadata for every cell, and rows are rebuilt
+    via `zip` rather than a Python-level loop.
+
+    Args:
+        connection: An open `k_ctds.Connection`.
+        table (str): The table to insert into.
+        columns (dict): A mapping of column name to an equal-length
+            sequence of values for that column, in table column order.
+        **kwargs: Additional keyword arguments passed through to
+            `Connection.bulk_insert`, e.g. `batch_size` or `tablock`.
+
+    Returns:
+        int: The number of rows saved.
+
+    Raises:
+        ValueError: If `columns` is empty, the column sequences have
+            differing lengths, or the table has no column metadata.
+    """
+    if not columns:
+        raise ValueError('no columns to insert')
+    if len(set(len(values) for values in columns.values())) > 1:
+        raise ValueError('columns must all be the same length')
+
+    # Values are encoded here; drop auto_encode to avoid a second pass.
+    kwargs.pop('auto_encode', None)
+
+    _, by_name = _get_column_codecs(connection, table)
+
+    encoded = [
+        _encode_column(values, by_name.get(name))
+        for name, values in columns.items()
+    ]
+
+    return connection.bulk_insert(table, zip(*encoded), **kwargs)
+
+
+def _chunked_encode_rows(rows, by_position, by_name, chunk_size=10000):
+    """
+    Generator that encodes rows as `_encode_rows` does, but yields them in
+    lists of at most `chunk_size` rows.
+
+    Consumers submitting rows to the server a block at a time (e.g. one
+    bcp_batch per chunk) can iterate chunks instead of rows and amortize
+    the per-submit overhead; `chunk_size` should typically match the
+    `batch_size` passed to `bulk_insert`.
+    """
+    chunk = []
+    for row in _encode_rows(rows, by_position, by_name):
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -220,6 +220,9 @@ struct Connection {
         by this connection.
     */
     enum ParamStyle paramstyle;
+
+    /* List of weak references to this connection. */
+    PyObject* weakreflist;
 };
 
 static PyObject* build_lastdberr_dict(const struct LastError* lasterror)
@@ -871,7 +874,12 @@ static const char s_tds_Connection_doc[] =
 
 static void Connection_dealloc(PyObject* self)
 {
-    Connection_free((struct Connection*)self);
+    struct Connection* connection = (struct Connection*)self;
+    if (NULL != connection->weakreflist)
+    {
+        PyObject_ClearWeakRefs(self);
+    }
+    Connection_free(connection);
     PyObject_Del(self);
 }
 
@@ -1424,7 +1432,9 @@ static const char s_Connection_bulk_insert_doc[] =
     "    to column names and must exist for all non-NULL columns.\n"
     ":type rows: :ref:`typeiter <python:typeiter>`\n"
 
-    ":param int batch_size: An optional batch size.\n"
+    ":param int batch_size: An optional batch size. If `None`, a batch\n"
+    "    size targeting roughly 8 MiB per batch is computed from the\n"
+    "    first row's approximate size. .. versionchanged:: 2.2\n"
 
     ":param bool tablock: Should the `TABLOCK` hint be passed?\n"
 
@@ -1439,6 +1449,43 @@ static const char s_Connection_bulk_insert_doc[] =
     ":return: The number of rows saved to the table.\n"
     ":rtype: int\n";
 
+/*
+    Estimate the size, in bytes, of a data row as sent on the wire.
+
+    The estimate is intentionally rough: variable-width values contribute
+    their Python length, everything else is assumed to be 8 bytes. It is
+    only used to select an automatic batch size.
+
+    @param sequence [in] The data row, as a `PySequence_Fast` object.
+
+    @return The estimated row size, in bytes.
+*/
+static size_t Connection_bulk_insert_row_estimate(PyObject* sequence)
+{
+    size_t estimate = 0;
+    Py_ssize_t ix;
+    Py_ssize_t size = PySequence_Fast_GET_SIZE(sequence);
+    for (ix = 0; ix < size; ++ix)
+    {
+        PyObject* item = PySequence_Fast_GET_ITEM(sequence, ix);
+        Py_ssize_t length = -1;
+        if (
+            PyBytes_Check(item) ||
+            PyByteArray_Check(item) ||
+            PyUnicode_Check(item)
+        )
+        {
+            length = PyObject_Length(item);
+            if (-1 == length)
+            {
+                PyErr_Clear();
+            }
+        }
+        estimate += (size_t)((-1 == length) ? 8 : length);
+    }
+    return estimate;
+}
+
 static DBINT Connection_bulk_insert_sendrow(struct Connection* connection,
                                             PyObject* sequence,
                                             bool send_batch)
@@ -1560,6 +1607,7 @@ static PyObject* Connection_bulk_insert(PyObject* self, PyObject* args, PyObject
 
     PyObject* irows;
     size_t batches = 0;
+    bool auto_batch;
 
     static char* s_kwlist[] =
     {
@@ -1591,6 +1639,7 @@ static PyObject* Connection_bulk_insert(PyObject* self, PyObject* args, PyObject
         return NULL;
     }
 
+    auto_batch = (Py_None == batch_size);
     if (Py_None != batch_size)
     {
         do
@@ -1747,6 +1796,13 @@ static PyObject* Connection_bulk_insert(PyObject* self, PyObject* args, PyObject
             }* columns = NULL;
             bool initialized = false;
 
+            /*
+                Rows are consumed strictly one at a time: each row is bound
+                and handed to bcp_sendrow(), which serializes into FreeTDS'
+                own network buffer. Generator arguments are therefore
+                streamed end to end and never materialized, regardless of
+                the total row count.
+            */
             while (NULL != (row = PyIter_Next(irows)))
             {
 #define INVALID_SEQUENCE_FMT "invalid sequence for row %zd"
@@ -1883,7 +1939,19 @@ static PyObject* Connection_bulk_insert(PyObject* self, PyObject* args, PyObject
 
                 if (sequence)
                 {
-                    bool send_batch = ((0 != batches) && ((sent + 1) % batches == 0));
+                    bool send_batch;
+                    if (auto_batch && (0 == sent))
+                    {
+                        /*
+                            Target roughly 8MiB of data per batch, sized
+                            from the first row. Oversized estimates only
+                            cause more frequent validation, never failure.
+                        */
+                        static const size_t s_batch_target = 8 * 1024 * 1024;
+                        size_t rowsize = Connection_bulk_insert_row_estimate(sequence);
+                        batches = MAX((size_t)1, s_batch_target / MAX(rowsize, (size_t)1));
+                    }
+                    send_batch = ((0 != batches) && ((sent + 1) % batches == 0));
                     processed = Connection_bulk_insert_sendrow(connection, sequence, send_batch);
                     if (-1 != processed)
                     {
@@ -2428,7 +2496,8 @@ PyTypeObject ConnectionType = {
     NULL,                          /* tp_traverse */
     NULL,                          /* tp_clear */
     NULL,                          /* tp_richcompare */
-    0,                             /* tp_weaklistoffset */
+    offsetof(struct Connection, weakreflist),
+                                   /* tp_weaklistoffset */
     NULL,                          /* tp_iter */
     NULL,                          /* tp_iternext */
     Connection_methods,            /* tp_methods */
@@ -130,6 +130,9 @@ struct Cursor {
     /* The number of rows read from the current result set. */
     size_t rowsread;
 
+    /* Whether the current result set has been read to completion. */
+    bool exhausted;
+
     /*
         The paramstyle to use on .execute*() calls.
     */
@@ -168,6 +171,7 @@ static void Cursor_clear_resultset(struct Cursor* cursor)
         cursor->description = NULL;
     }
     cursor->rowsread = 0;
+    cursor->exhausted = false;
 }
 
 /*
@@ -664,6 +668,26 @@ static PyObject* Cursor_spid_get(PyObject* self, void* closure)
     UNUSED(closure);
 }
 
+static const char s_Cursor_exhausted_doc[] =
+    ":py:data:`True` if all rows in the current result set have been fetched,\n"
+    ":py:data:`False` otherwise. Unlike calling :py:meth:`.fetchall` again,\n"
+    "checking this does not enter the fetch machinery.\n"
+    "\n"
+    ".. versionadded:: 2.2\n"
+    "\n"
+    ":rtype: bool\n";
+
+static PyObject* Cursor_exhausted_get(PyObject* self, void* closure)
+{
+    struct Cursor* cursor = (struct Cursor*)self;
+
+    Cursor_verify_open(cursor);
+
+    return PyBool_FromLong(cursor->exhausted);
+
+    UNUSED(closure);
+}
+
 static const char s_Cursor_Parameter_doc[] =
     "Convenience method to :py:class:`k_ctds.Parameter`.\n"
     "\n"
@@ -688,6 +712,7 @@ static PyGetSetDef Cursor_getset[] = {
     { (char*)"connection",  Cursor_connection_get,  NULL,                 (char*)s_Cursor_connection_doc,  NULL },
     { (char*)"rownumber",   Cursor_rownumber_get,   NULL,                 (char*)s_Cursor_rownumber_doc,   NULL },
     { (char*)"spid",        Cursor_spid_get,        NULL,                 (char*)s_Cursor_spid_doc,        NULL },
+    { (char*)"exhausted",   Cursor_exhausted_get,   NULL,                 (char*)s_Cursor_exhausted_doc,   NULL },
     { (char*)"Parameter",   Cursor_Parameter_get,   NULL,                 (char*)s_Cursor_Parameter_doc,   NULL },
     { NULL,                 NULL,                   NULL,                 NULL,                            NULL }
 };
@@ -2613,6 +2638,16 @@ struct Row {
 
     struct ResultSetDescription* description;
 
+    /*
+        The raw TDS data for the row. Column values are converted to
+        Python objects from this buffer on first access; the buffer is
+        released once every column has been converted.
+    */
+    struct RowBuffer* rowbuffer;
+
+    /* The number of non-NULL entries in `values`. */
+    size_t nconverted;
+
     PyObject* values[1]; /* space for row data values is added by tp_alloc() */
 };
 
@@ -2624,79 +2659,118 @@ static void Row_dealloc(PyObject* self)
     {
         Py_XDECREF(row->values[ix]);
     }
+    if (row->rowbuffer)
+    {
+        ResultSetDescription_RowBuffer_free(row->description, row->rowbuffer);
+    }
     ResultSetDescription_decrement(row->description);
     PyObject_Del(self);
 }
 
+/*
+    Convert a single buffered column value to its Python object
+    representation.
+
+    @note This method sets an appropriate Python exception on error.
+    @note This method returns a new reference.
+
+    @param column [in] The column metadata.
+    @param colbuffer [in] The buffered column value.
+
+    @return The Python object representing the column value.
+    @return NULL on failure.
+*/
+static PyObject* ColumnBuffer_topython(const struct Column* column,
+                                       const struct ColumnBuffer* colbuffer)
+{
+    const void* data;
+
+    if (!column->topython)
+    {
+        PyErr_Format(PyExc_tds_NotSupportedError,
+                     "unsupported type %d for column \"%s\"",
+                     column->dbcol.Type,
+                     column->dbcol.ActualName);
+        return NULL;
+    }
+
+    data = (Column_IsVariableLength(&column->dbcol)) ?
+        colbuffer->data.variable : &colbuffer->data.fixed;
+
+    /*
+        Used the cached column converter if the type is expected.
+        The type may differ for COMPUTE columns, in which case the
+        converter won't be cached.
+    */
+    if ((enum TdsType)column->dbcol.Type == colbuffer->tdstype)
+    {
+        return column->topython(colbuffer->tdstype,
+                                data,
+                                colbuffer->size);
+    }
+    else
+    {
+        sql_topython topython = sql_topython_lookup(colbuffer->tdstype);
+        assert(topython);
+        return topython(colbuffer->tdstype,
+                        data,
+                        colbuffer->size);
+    }
+}
+
 PyTypeObject RowType; /* forward decl. */
+
+/*
+    Create a Row wrapping a raw row buffer.
+
+    Column values are *not* converted here; they are materialized lazily
+    on first access, so columns a client never touches never allocate a
+    Python object.
+
+    @note On success, ownership of `rowbuffer` is transferred to the Row.
+        On failure, the caller retains ownership.
+
+    @param description [in] A description of the result set.
+    @param rowbuffer [in] The buffered row data. This must be a single
+        row, i.e. `rowbuffer->next` must be NULL.
+
+    @return A new Row object, or NULL on failure.
+*/
 static struct Row* Row_create(struct ResultSetDescription* description,
-                              const struct RowBuffer* rowbuffer)
+                              struct RowBuffer* rowbuffer)
 {
     struct Row* row = PyObject_NewVar(struct Row, &RowType, (Py_ssize_t)description->ncolumns);
     if (row)
     {
-        /* The offset to the next column buffer in the row. */
-        size_t offset = 0;
         size_t ixcol;
 
+        assert(NULL == rowbuffer->next);
+
         memset(row->values, 0, description->ncolumns * sizeof(*row->values));
         row->description = description;
+        row->rowbuffer = NULL;
+        row->nconverted = 0;
         ResultSetDescription_increment(description);
 
+        /*
+            Validate the column types up front so unsupported types still
+            fail at fetch time rather than on first access.
+        */
         for (ixcol = 0; ixcol < description->ncolumns; ++ixcol)
         {
             const struct Column* column = &description->columns[ixcol];
-
-            if (column->topython)
-            {
-                const struct ColumnBuffer* colbuffer = (const struct ColumnBuffer*)(((const char*)rowbuffer->columns) + offset);
-
-                const void* data = (Column_IsVariableLength(&column->dbcol)) ?
-                    colbuffer->data.variable : &colbuffer->data.fixed;
-
-                PyObject* object = NULL;
-
-                /*
-                    Used the cached column converter if the type is expected.
-                    The type may differ for COMPUTE columns, in which case the
-                    converter won't be cached.
-                */
-                if ((enum TdsType)column->dbcol.Type == colbuffer->tdstype)
-                {
-                    object = column->topython(colbuffer->tdstype,
-                                              data,
-                                              colbuffer->size);
-                }
-                else
-                {
-                    sql_topython topython = sql_topython_lookup(colbuffer->tdstype);
-                    assert(topython);
-                    object = topython(colbuffer->tdstype,
-                                      data,
-                                      colbuffer->size);
-                }
-                if (!object)
-                {
-                    break;
-                }
-
-                row->values[ixcol] = object; /* object reference stolen */
-            }
-            else
+            if (!column->topython)
             {
                 PyErr_Format(PyExc_tds_NotSupportedError,
                              "unsupported type %d for column \"%s\"",
                              column->dbcol.Type,
                              column->dbcol.ActualName);
-                break;
+                Py_DECREF(row);
+                return NULL;
             }
-            offset += ColumnBuffer_size(&column->dbcol);
-        }
-        if (PyErr_Occurred())
-        {
-            Py_DECREF(row);
-            row = NULL;
         }
+
+        row->rowbuffer = rowbuffer; /* rowbuffer ownership stolen */
     }
     else
     {
@@ -2705,6 +2779,52 @@ static struct Row* Row_create(struct ResultSetDescription* description,
     return row;
 }
 
+/*
+    Get the Python object for a row column, converting it from the
+    buffered TDS data on first access.
+
+    @note This method sets an appropriate Python exception on error.
+    @note This method returns a borrowed reference.
+
+    @param row [in] The row.
+    @param ix [in] The column index. Must be within range.
+
+    @return The Python object representing the column value.
+    @return NULL on failure.
+*/
+static PyObject* Row_value(struct Row* row, size_t ix)
+{
+    assert(ix < row->description->ncolumns);
+    if (!row->values[ix])
+    {
+        const struct ColumnBuffer* colbuffer;
+        size_t offset = 0;
+        size_t ixcol;
+
+        assert(row->rowbuffer);
+        for (ixcol = 0; ixcol < ix; ++ixcol)
+        {
+            offset += ColumnBuffer_size(&row->description->columns[ixcol].dbcol);
+        }
+        colbuffer = (const struct ColumnBuffer*)(((const char*)row->rowbuffer->columns) + offset);
+
+        row->values[ix] = ColumnBuffer_topython(&row->description->columns[ix],
+                                                colbuffer);
+        if (!row->values[ix])
+        {
+            return NULL;
+        }
+
+        /* Release the raw data once every column has been converted. */
+        if (++row->nconverted == row->description->ncolumns)
+        {
+            ResultSetDescription_RowBuffer_free(row->description, row->rowbuffer);
+            row->rowbuffer = NULL;
+        }
+    }
+    return row->values[ix];
+}
+
 static PyObject* Row_lookup_column(PyObject* self, PyObject* item, PyObject* error)
 {
     struct Row* row = (struct Row*)self;
@@ -2743,8 +2863,8 @@ static PyObject* Row_lookup_column(PyObject* self, PyObject* item, PyObject* err
         {
             if (0 == strcmp(name, row->description->columns[ix].dbcol.ActualName))
             {
-                Py_INCREF(row->values[ix]);
-                value = row->values[ix];
+                value = Row_value(row, ix);
+                Py_XINCREF(value);
                 break;
             }
         }
@@ -2754,7 +2874,8 @@ static PyObject* Row_lookup_column(PyObject* self, PyObject* item, PyObject* err
     Py_XDECREF(utf8item);
 #endif /* if PY_MAJOR_VERSION < 3 */
 
-    if (!value && error != NULL)
+    /* Don't mask a conversion failure from Row_value(). */
+    if (!value && !PyErr_Occurred() && (error != NULL))
     {
         PyErr_SetObject(error, item);
     }
@@ -2770,13 +2891,15 @@ static Py_ssize_t Row_len(PyObject* self)
 static PyObject* Row_item(PyObject* self, Py_ssize_t ix)
 {
     struct Row* row = (struct Row*)self;
+    PyObject* value;
     if (ix < 0 || ix >= (Py_ssize_t)row->description->ncolumns)
     {
         PyErr_SetString(PyExc_IndexError, "index is out of range");
         return NULL;
     }
-    Py_INCREF(row->values[ix]);
-    return row->values[ix];
+    value = Row_value(row, (size_t)ix);
+    Py_XINCREF(value);
+    return value;
 }
 
 static int Row_contains(PyObject* self, PyObject* value)
@@ -2784,6 +2907,10 @@ static int Row_contains(PyObject* self, PyObject* value)
     PyObject* item = Row_lookup_column(self, value, NULL);
     int contains = (NULL != item) ? 1 : 0;
     Py_XDECREF(item);
+    if (!item && PyErr_Occurred())
+    {
+        return -1;
+    }
     return contains;
 }
 
@@ -2893,8 +3020,13 @@ static PyObject* Row_dict(PyObject* self, PyObject* args)
             assert((Py_ssize_t)ncolumns == PyTuple_GET_SIZE(description));
             for (ix = 0; ix < ncolumns; ++ix)
             {
-                PyObject* value = row->values[ix];
-                PyObject* colname = Description_GET_ITEM(PyTuple_GET_ITEM(description, ix), 0);
+                PyObject* value = Row_value(row, ix);
+                PyObject* colname;
+                if (!value)
+                {
+                    break;
+                }
+                colname = Description_GET_ITEM(PyTuple_GET_ITEM(description, ix), 0);
                 if (0 == PyObject_IsTrue(colname))
                 {
                     /* Use the column number as the key for unnamed columns. */
@@ -2951,7 +3083,8 @@ static PyObject* Row_repr(PyObject* self)
     for (ix = 0; ix < ncols; ++ix)
     {
         const char* colname = row->description->columns[ix].dbcol.ActualName;
-        PyObject* value_repr = PyObject_Repr(row->values[ix]);
+        PyObject* value = Row_value(row, ix);
+        PyObject* value_repr = (value) ? PyObject_Repr(value) : NULL;
         PyObject* piece;
 
         if (!value_repr)
@@ -2992,6 +3125,80 @@ static PyObject* Row_repr(PyObject* self)
     }
 }
 
+static PyObject* Row_richcompare(PyObject* self, PyObject* other, int op)
+{
+    struct Row* row = (struct Row*)self;
+    Py_ssize_t ncolumns = (Py_ssize_t)row->description->ncolumns;
+    Py_ssize_t ix;
+    int equal = 1;
+
+    /*
+        Only equality against other sequences (e.g. tuple, list, Row) is
+        supported. Exclude str/bytes, which are technically sequences but
+        never meaningfully comparable to a row.
+    */
+    if (
+        ((Py_EQ != op) && (Py_NE != op)) ||
+        !PySequence_Check(other) ||
+        PyUnicode_Check(other) ||
+        PyBytes_Check(other)
+    )
+    {
+        Py_INCREF(Py_NotImplemented);
+        return Py_NotImplemented;
+    }
+
+    if (PySequence_Size(other) != ncolumns)
+    {
+        if (PyErr_Occurred())
+        {
+            return NULL;
+        }
+        equal = 0;
+    }
+    else
+    {
+        for (ix = 0; ix < ncolumns; ++ix)
+        {
+            /* Converted lazily; the raw column data is only materialized
+               up to the first mismatch. */
+            PyObject* value = Row_value(row, (size_t)ix);
+            PyObject* othervalue;
+            int eq;
+            if (!value)
+            {
+                return NULL;
+            }
+            othervalue = PySequence_GetItem(other, ix);
+            if (!othervalue)
+            {
+                return NULL;
+            }
+            eq = PyObject_RichCompareBool(value, othervalue, Py_EQ);
+            Py_DECREF(othervalue);
+            if (-1 == eq)
+            {
+                return NULL;
+            }
+            if (!eq)
+            {
+                equal = 0;
+                break;
+            }
+        }
+    }
+
+    if (Py_NE == op)
+    {
+        equal = !equal;
+    }
+    if (equal)
+    {
+        Py_RETURN_TRUE;
+    }
+    Py_RETURN_FALSE;
+}
+
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wmissing-field-initializers"
 PyTypeObject RowType = {
@@ -3022,7 +3229,7 @@ PyTypeObject RowType = {
     NULL,                                     /* tp_doc */
     NULL,                                     /* tp_traverse */
     NULL,                                     /* tp_clear */
-    NULL,                                     /* tp_richcompare */
+    Row_richcompare,                          /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     NULL,                                     /* tp_iter */
     NULL,                                     /* tp_iternext */
@@ -3162,13 +3369,12 @@ static PyObject* RowList_item(PyObject* self, Py_ssize_t ix)
         struct Row* row = Row_create(rowlist->description, rowbuffer);
         if (!row)
         {
+            /* `rowbuffer` ownership is retained on failure. */
             assert(PyErr_Occurred());
             return NULL;
         }
 
-        ResultSetDescription_RowBuffer_free(rowlist->description,
-                                            rowbuffer);
-
+        /* `rowbuffer` ownership transferred to the Row. */
         rowlist->rows[ix].row.python = (PyObject*)row; /* claim reference */
         rowlist->rows[ix].converted = true;
     }
@@ -3425,6 +3631,15 @@ static struct RowList* Cursor_fetchrows(struct Cursor* cursor, size_t n)
     /* Update the rows read count before returning any errors. */
     cursor->rowsread += rows;
 
+    /*
+        The result set is exhausted only if the loop stopped short of the
+        requested row count due to NO_MORE_ROWS.
+    */
+    if ((NO_MORE_ROWS == retcode) && ((rows < n) || (FETCH_ALL == n)))
+    {
+        cursor->exhausted = true;
+    }
+
     if (NO_MORE_ROWS != retcode)
     {
         if (!rowbuffers)
@@ -3492,6 +3707,80 @@ static PyObject* Cursor_fetchone(PyObject* self, PyObject* args)
     UNUSED(args);
 }
 
+static const char s_Cursor_fetchval_doc[] =
+    "fetchval(index=0)\n"
+    "\n"
+    "Fetch the given column of the next row of a query result set,\n"
+    "returning the value, or :py:data:`None` when no more data is\n"
+    "available. This avoids creating a :py:class:`k_ctds.Row` object for\n"
+    "single-value queries, such as ``SELECT COUNT(*) ...``.\n"
+    "\n"
+    ".. versionadded:: 2.2\n"
+    "\n"
+    ":param int index: The index of the column to return. Defaults to 0.\n"
+    "\n"
+    ":return: The next row's column value or :py:data:`None`.\n";
+
+static PyObject* Cursor_fetchval(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    struct Cursor* cursor = (struct Cursor*)self;
+    struct RowList* rowlist;
+    PyObject* value = NULL;
+
+    static char* s_kwlist[] =
+    {
+        "index",
+        NULL
+    };
+    Py_ssize_t index = 0;
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|n", s_kwlist, &index))
+    {
+        return NULL;
+    }
+    Cursor_verify_open(cursor);
+    Cursor_verify_connection_open(cursor);
+
+    rowlist = Cursor_fetchrows(cursor, 1);
+    if (!rowlist)
+    {
+        return NULL;
+    }
+
+    if (Py_SIZE(rowlist) > 0)
+    {
+        const struct ResultSetDescription* description = rowlist->description;
+        if ((index < 0) || ((size_t)index >= description->ncolumns))
+        {
+            PyErr_SetString(PyExc_IndexError, "index is out of range");
+        }
+        else
+        {
+            /* The rows in a freshly fetched row list are never converted. */
+            const struct RowBuffer* rowbuffer = rowlist->rows[0].row.rowbuffer;
+            size_t offset = 0;
+            Py_ssize_t ixcol;
+            assert(!rowlist->rows[0].converted);
+
+            for (ixcol = 0; ixcol < index; ++ixcol)
+            {
+                offset += ColumnBuffer_size(&description->columns[ixcol].dbcol);
+            }
+            value = ColumnBuffer_topython(
+                &description->columns[index],
+                (const struct ColumnBuffer*)(((const char*)rowbuffer->columns) + offset)
+            );
+        }
+    }
+    else
+    {
+        value = Py_None;
+        Py_INCREF(value);
+    }
+
+    Py_DECREF(rowlist);
+    return value;
+}
+
 /* https://www.python.org/dev/peps/pep-0249/#fetchmany */
 static const char s_Cursor_fetchmany_doc[] =
     "fetchmany(size=self.arraysize)\n"
@@ -3546,6 +3835,225 @@ static PyObject* Cursor_fetchall(PyObject* self, PyObject* args)
     UNUSED(args);
 }
 
+static const char s_Cursor_fetchall_tuples_doc[] =
+    "fetchall_tuples()\n"
+    "\n"
+    "Fetch all (remaining) rows of a query result, returning them as a\n"
+    ":py:class:`list` of :py:class:`tuple` objects.\n"
+    "\n"
+    "This is equivalent to ``[tuple(row) for row in cursor.fetchall()]``,\n"
+    "but converts the buffered column data directly to tuples without\n"
+    "creating intermediate :py:class:`k_ctds.Row` objects.\n"
+    "\n"
+    ".. versionadded:: 2.2\n"
+    "\n"
+    ":return: A list of result rows.\n"
+    ":rtype: list(tuple)\n";
+
+static PyObject* Cursor_fetchall_tuples(PyObject* self, PyObject* args)
+{
+    struct Cursor* cursor = (struct Cursor*)self;
+    struct RowList* rowlist;
+    PyObject* list;
+    Py_ssize_t nrows;
+    Py_ssize_t ixrow;
+
+    Cursor_verify_open(cursor);
+    Cursor_verify_connection_open(cursor);
+
+    rowlist = Cursor_fetchrows(cursor, FETCH_ALL);
+    if (!rowlist)
+    {
+        return NULL;
+    }
+
+    nrows = Py_SIZE(rowlist);
+    list = PyList_New(nrows);
+    if (list)
+    {
+        const struct ResultSetDescription* description = rowlist->description;
+        for (ixrow = 0; ixrow < nrows; ++ixrow)
+        {
+            /* The rows in a freshly fetched row list are never converted. */
+            const struct RowBuffer* rowbuffer = rowlist->rows[ixrow].row.rowbuffer;
+            size_t offset = 0;
+            size_t ixcol;
+
+            PyObject* tuple;
+            assert(!rowlist->rows[ixrow].converted);
+
+            tuple = PyTuple_New((Py_ssize_t)description->ncolumns);
+            if (!tuple)
+            {
+                break;
+            }
+
+            for (ixcol = 0; ixcol < description->ncolumns; ++ixcol)
+            {
+                const struct Column* column = &description->columns[ixcol];
+                const struct ColumnBuffer* colbuffer = (const struct ColumnBuffer*)(((const char*)rowbuffer->columns) + offset);
+
+                PyObject* object = ColumnBuffer_topython(column, colbuffer);
+                if (!object)
+                {
+                    break;
+                }
+
+                PyTuple_SET_ITEM(tuple, (Py_ssize_t)ixcol, object); /* object reference stolen */
+
+                offset += ColumnBuffer_size(&column->dbcol);
+            }
+
+            if (PyErr_Occurred())
+            {
+                Py_DECREF(tuple);
+                break;
+            }
+
+            PyList_SET_ITEM(list, ixrow, tuple); /* tuple reference stolen */
+        }
+
+        if (PyErr_Occurred())
+        {
+            Py_DECREF(list);
+            list = NULL;
+        }
+    }
+
+    Py_DECREF(rowlist);
+    return list;
+
+    UNUSED(args);
+}
+
+static const char s_Cursor_fetchall_columns_doc[] =
+    "fetchall_columns()\n"
+    "\n"
+    "Fetch all (remaining) rows of a query result in columnar form: a\n"
+    ":py:class:`dict` mapping each column name to a :py:class:`list` of\n"
+    "that column's values. Unnamed columns are keyed by their integer\n"
+    "column number, as in :py:meth:`k_ctds.Row.dict`.\n"
+    "\n"
+    ".. versionadded:: 2.2\n"
+    "\n"
+    ":return: A dict of column value lists.\n"
+    ":rtype: dict\n";
+
+static PyObject* Cursor_fetchall_columns(PyObject* self, PyObject* args)
+{
+    struct Cursor* cursor = (struct Cursor*)self;
+    struct RowList* rowlist;
+    PyObject* dict = NULL;
+    Py_ssize_t nrows;
+
+    Cursor_verify_open(cursor);
+    Cursor_verify_connection_open(cursor);
+
+    rowlist = Cursor_fetchrows(cursor, FETCH_ALL);
+    if (!rowlist)
+    {
+        return NULL;
+    }
+
+    nrows = Py_SIZE(rowlist);
+    dict = PyDict_New();
+    if (dict)
+    {
+        const struct ResultSetDescription* description = rowlist->description;
+        size_t ncolumns = description->ncolumns;
+        size_t ixcol;
+        Py_ssize_t ixrow;
+
+        /*
+            Owned references to the per-column lists. The dict holds its
+            own references, so these remain valid even if a duplicated
+            column name displaces an earlier dict entry.
+        */
+        PyObject** lists = tds_mem_calloc(ncolumns, sizeof(PyObject*));
+        if (!lists)
+        {
+            PyErr_NoMemory();
+        }
+
+        for (ixcol = 0; lists && (ixcol < ncolumns); ++ixcol)
+        {
+            const char* name = description->columns[ixcol].dbcol.ActualName;
+            PyObject* key;
+            PyObject* list = PyList_New(nrows);
+            if (!list)
+            {
+                break;
+            }
+            lists[ixcol] = list;
+
+            if ('\0' != name[0])
+            {
+                key = PyUnicode_FromString(name);
+            }
+            else
+            {
+                /* Use the column number as the key for unnamed columns. */
+                key = PyLong_FromSize_t(ixcol);
+            }
+            if (!key)
+            {
+                break;
+            }
+
+            if (0 != PyDict_SetItem(dict, key, list))
+            {
+                Py_DECREF(key);
+                break;
+            }
+            Py_DECREF(key);
+        }
+
+        for (ixrow = 0; !PyErr_Occurred() && (ixrow < nrows); ++ixrow)
+        {
+            /* The rows in a freshly fetched row list are never converted. */
+            const struct RowBuffer* rowbuffer = rowlist->rows[ixrow].row.rowbuffer;
+            size_t offset = 0;
+            assert(!rowlist->rows[ixrow].converted);
+
+            for (ixcol = 0; ixcol < ncolumns; ++ixcol)
+            {
+                const struct Column* column = &description->columns[ixcol];
+                const struct ColumnBuffer* colbuffer = (const struct ColumnBuffer*)(((const char*)rowbuffer->columns) + offset);
+
+                PyObject* object = ColumnBuffer_topython(column, colbuffer);
+                if (!object)
+                {
+                    break;
+                }
+
+                PyList_SET_ITEM(lists[ixcol], ixrow, object); /* object reference stolen */
+
+                offset += ColumnBuffer_size(&column->dbcol);
+            }
+        }
+
+        if (lists)
+        {
+            for (ixcol = 0; ixcol < ncolumns; ++ixcol)
+            {
+                Py_XDECREF(lists[ixcol]);
+            }
+            tds_mem_free(lists);
+        }
+
+        if (PyErr_Occurred())
+        {
+            Py_DECREF(dict);
+            dict = NULL;
+        }
+    }
+
+    Py_DECREF(rowlist);
+    return dict;
+
+    UNUSED(args);
+}
+
 /* https://www.python.org/dev/peps/pep-0249/#nextset */
 static const char s_Cursor_nextset_doc[] =
     "nextset()\n"
@@ -3716,12 +4224,15 @@ static PyMethodDef Cursor_methods[] = {
     { "execute",       Cursor_execute,               METH_VARARGS,                  s_Cursor_execute_doc },
     { "executemany",   Cursor_executemany,           METH_VARARGS,                  s_Cursor_executemany_doc },
     { "fetchone",      Cursor_fetchone,              METH_NOARGS,                   s_Cursor_fetchone_doc },
+    { "fetchval",      (PyCFunction)Cursor_fetchval, METH_VARARGS | METH_KEYWORDS,  s_Cursor_fetchval_doc },
     /*
         fetchmany does not have *args, but the flag is required for kwargs to function properly.
         See https://bugs.python.org/issue15657.
     */
     { "fetchmany",     (PyCFunction)Cursor_fetchmany, METH_VARARGS | METH_KEYWORDS, s_Cursor_fetchmany_doc },
     { "fetchall",      Cursor_fetchall,               METH_NOARGS,                  s_Cursor_fetchall_doc },
+    { "fetchall_tuples", Cursor_fetchall_tuples,      METH_NOARGS,                  s_Cursor_fetchall_tuples_doc },
+    { "fetchall_columns", Cursor_fetchall_columns,    METH_NOARGS,                  s_Cursor_fetchall_columns_doc },
     { "nextset",       Cursor_nextset,                METH_NOARGS,                  s_Cursor_nextset_doc },
     { "setinputsizes", Cursor_setinputsizes,          METH_VARARGS,                 s_Cursor_setinputsizes_doc },
     { "setoutputsize", Cursor_setoutputsize,          METH_VARARGS,                 s_Cursor_setoutputsize_doc },
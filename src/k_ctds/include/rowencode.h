@@ -0,0 +1,28 @@
+#ifndef __ROWENCODE_H__
+#define __ROWENCODE_H__
+
+#include "push_warnings.h"
+#include <Python.h>
+#include "pop_warnings.h"
+
+/**
+    Initialize the RowEncoder Python type object.
+
+    @note This method returns a new reference.
+
+    @return NULL indicating the initialization failed.
+    @return The initialized Python type object.
+*/
+PyTypeObject* RowEncoderType_init(void);
+
+/**
+    `encode_rows(rows, by_position, by_name, wrapper)` method implementation.
+
+    Returns an iterator which yields rows from `rows` with str values
+    encoded per the column codec metadata and wrapped in `wrapper`.
+*/
+PyObject* tds_encode_rows(PyObject* self, PyObject* args);
+
+extern const char s_tds_encode_rows_doc[];
+
+#endif /* ifndef __ROWENCODE_H__ */
@@ -1,11 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from collections import namedtuple
+import queue
 import threading
 import time
 import warnings
 
 PooledConnection = namedtuple('PooledConnection', ['connection', 'released'])
 
+# Marker placed on the chunk queue to tell a bulk insert worker to stop.
+_BULK_INSERT_DONE = object()
+
 
 class ConnectionPool(object): # pylint: disable=too-many-instance-attributes,useless-object-inheritance
     '''
@@ -180,6 +185,100 @@ class ConnectionPool(object): # pylint: disable=too-many-instance-attributes,use
         finally:
             self._condition.release()
 
+    def bulk_insert( # pylint: disable=too-many-arguments
+            self,
+            table,
+            rows,
+            parallelism=4,
+            chunk_size=10000,
+            **kwargs
+    ):
+        '''
+        Bulk insert an iterable of rows into a table, splitting the work
+        across multiple pooled connections.
+
+        Rows are consumed from `rows` in chunks of `chunk_size` and
+        distributed to `parallelism` worker threads, each of which owns one
+        connection acquired from the pool and runs its own
+        :py:meth:`k_ctds.Connection.bulk_insert` stream. The driver releases
+        the GIL during server writes, so streams overlap effectively.
+
+        .. warning:: Each worker commits its own connection. The insert is
+            therefore **not** atomic across workers: on error, chunks
+            already committed by other workers remain in the table.
+
+        .. versionadded:: 2.2
+
+        :param str table: The table to insert into.
+
+        :param rows: An iterable of rows to insert.
+
+        :param int parallelism: The number of worker threads (and pooled
+            connections) to use.
+
+        :param int chunk_size: The number of rows handed to a worker at a
+            time.
+
+        :param kwargs: Additional keyword arguments passed through to
+            :py:meth:`k_ctds.Connection.bulk_insert`, e.g. `batch_size`,
+            `tablock` or `auto_encode`.
+
+        :return: The number of rows saved across all workers.
+        :rtype: int
+        '''
+        if parallelism < 1:
+            raise ValueError('parallelism must be >= 1')
+
+        chunks = queue.Queue(maxsize=parallelism * 2)
+
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            futures = [
+                executor.submit(self._bulk_insert_worker, table, chunks, kwargs)
+                for _ in range(parallelism)
+            ]
+
+            def enqueue(item):
+                # Don't block forever on a full queue if all workers have
+                # failed; the error surfaces from the futures below.
+                while True:
+                    try:
+                        chunks.put(item, timeout=1)
+                        return True
+                    except queue.Full:
+                        if all(future.done() for future in futures):
+                            return False
+
+            chunk = []
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    if not enqueue(chunk):
+                        break
+                    chunk = []
+            else:
+                if chunk:
+                    enqueue(chunk)
+
+            for _ in futures:
+                if not enqueue(_BULK_INSERT_DONE):
+                    break
+
+            return sum(future.result() for future in futures)
+
+    def _bulk_insert_worker(self, table, chunks, kwargs):
+        saved = 0
+        connection = self.acquire()
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is _BULK_INSERT_DONE:
+                    break
+                saved += connection.bulk_insert(table, chunk, **kwargs)
+            connection.commit()
+        finally:
+            self.release(connection)
+        return saved
+
     def finalize(self):
         '''
         Release all connections contained in the pool.
@@ -204,6 +204,18 @@ PyObject* PyDelta_FromDSU_(int days, int seconds, int useconds)
 
 PyObject* PyTimeZone_FromOffset_(PyObject* offset)
 {
+    /*
+        Return the interned UTC singleton for zero offsets so UTC values
+        share one tzinfo instance and comparisons against
+        `datetime.timezone.utc` can short-circuit on identity.
+    */
+    if ((0 == PyDateTime_DELTA_GET_DAYS(offset)) &&
+        (0 == PyDateTime_DELTA_GET_SECONDS(offset)) &&
+        (0 == PyDateTime_DELTA_GET_MICROSECONDS(offset)))
+    {
+        Py_INCREF(PyDateTime_TimeZone_UTC);
+        return PyDateTime_TimeZone_UTC;
+    }
     return PyTimeZone_FromOffset(offset);
 }
 
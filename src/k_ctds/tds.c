@@ -10,6 +10,7 @@
 #include "include/macros.h"
 #include "include/parameter.h"
 #include "include/pyutils.h"
+#include "include/rowencode.h"
 #include "include/tds.h"
 #include "include/type.h"
 
@@ -516,6 +517,7 @@ static PyMethodDef s_tds_methods[] = {
     { "TimeFromTicks",      tds_TimeFromTicks,        METH_VARARGS,                 s_tds_TimeFromTicks_doc },
     { "TimestampFromTicks", tds_TimestampFromTicks,   METH_VARARGS,                 s_tds_TimestampFromTicks_doc },
     { "Binary",             tds_Binary,               METH_VARARGS,                 s_tds_Binary_doc },
+    { "encode_rows",        tds_encode_rows,          METH_VARARGS,                 s_tds_encode_rows_doc },
     { NULL,                 NULL,                     0,                            NULL }
 };
 
@@ -855,6 +857,8 @@ PyMODINIT_FUNC PyInit__tds(void)
     if (0 != PyModule_AddObject(module, "RowList", (PyObject*)RowListType_init())) FAIL_MODULE_INIT;
     if (0 != PyModule_AddObject(module, "Row", (PyObject*)RowType_init())) FAIL_MODULE_INIT;
 
+    if (NULL == RowEncoderType_init()) FAIL_MODULE_INIT;
+
     if (0 != SqlTypes_init()) FAIL_MODULE_INIT;
 
     /* Add SQL type wrappers (in alphabetical order). */
@@ -1085,6 +1085,46 @@ static PyObject* MONEY_topython(enum TdsType tdstype, const void* data, size_t n
                             (size_t)size);
 }
 
+/*
+    DATETIMEOFFSET offsets are whole minutes in [-14:00, +14:00]. Cache the
+    constructed `datetime.timezone` objects, keyed by offset, so every row
+    with the same offset shares one tzinfo instance. The cached references
+    are intentionally retained for the life of the process.
+*/
+#define TIMEZONE_OFFSET_MINUTES_MAX (14 * 60)
+
+static PyObject* s_timezone_cache[2 * TIMEZONE_OFFSET_MINUTES_MAX + 1];
+
+static PyObject* Timezone_fromtzone(int tzone)
+{
+    PyObject* tz;
+    PyObject* timedelta;
+
+    if ((tzone >= -TIMEZONE_OFFSET_MINUTES_MAX) && (tzone <= TIMEZONE_OFFSET_MINUTES_MAX))
+    {
+        tz = s_timezone_cache[tzone + TIMEZONE_OFFSET_MINUTES_MAX];
+        if (tz)
+        {
+            Py_INCREF(tz);
+            return tz;
+        }
+    }
+
+    timedelta = PyDelta_FromDSU_(0, tzone * 60, 0);
+    if (!timedelta) return NULL;
+
+    tz = PyTimeZone_FromOffset_(timedelta);
+    Py_DECREF(timedelta);
+    if (!tz) return NULL;
+
+    if ((tzone >= -TIMEZONE_OFFSET_MINUTES_MAX) && (tzone <= TIMEZONE_OFFSET_MINUTES_MAX))
+    {
+        Py_INCREF(tz); /* reference owned by the cache */
+        s_timezone_cache[tzone + TIMEZONE_OFFSET_MINUTES_MAX] = tz;
+    }
+    return tz;
+}
+
 static PyObject* DATETIME_topython(enum TdsType tdstype, const void* data, size_t ndata)
 {
     DBDATETIME dbdatetime;
@@ -1171,11 +1211,7 @@ static PyObject* DATETIME_topython(enum TdsType tdstype, const void* data, size_
                         (e.g., -300 for US Eastern, +330 for IST).
                         Build a Python timezone-aware datetime.
                     */
-                    PyObject* timedelta = PyDelta_FromDSU_(0, dbdaterec.tzone * 60, 0);
-                    if (!timedelta) return NULL;
-
-                    PyObject* tz = PyTimeZone_FromOffset_(timedelta);
-                    Py_DECREF(timedelta);
+                    PyObject* tz = Timezone_fromtzone(dbdaterec.tzone);
                     if (!tz) return NULL;
 
                     PyObject* result = PyDateTime_FromDateAndTimeAndTZ_(
@@ -1468,6 +1504,25 @@ PyObject* encode_for_dblib(PyObject* unicode, const char** utf8bytes, size_t* nu
     return encoded;
 }
 
+/*
+    Days between 1900-01-01 and the given date, computed via the Julian
+    Day Number algorithm. JDN of 1900-01-01 = 2415021.
+*/
+static DBINT datetime_days_from_1900(int year, int month, int day)
+{
+    int a = (14 - month) / 12;
+    int y = year + 4800 - a;
+    int m = month + 12 * a - 3;
+    long jdn = day
+             + (153 * m + 2) / 5
+             + 365 * y
+             + y / 4
+             - y / 100
+             + y / 400
+             - 32045;
+    return (DBINT)(jdn - 2415021);
+}
+
 int datetime_to_sql(DBPROCESS* dbproc,
                     PyObject* o,
                     enum TdsType* tdstype,
@@ -1601,23 +1656,9 @@ int datetime_to_sql(DBPROCESS* dbproc,
                 utc_usecond = PyDateTime_DATE_GET_MICROSECOND_(utc_dt);
                 Py_DECREF(utc_dt);
 
-                /*
-                    Compute days since 1900-01-01 using the Julian Day Number
-                    algorithm. JDN of 1900-01-01 = 2415021.
-                */
-                {
-                    int a = (14 - utc_month) / 12;
-                    int y = utc_year + 4800 - a;
-                    int m = utc_month + 12 * a - 3;
-                    long jdn = utc_day
-                             + (153 * m + 2) / 5
-                             + 365 * y
-                             + y / 4
-                             - y / 100
-                             + y / 400
-                             - 32045;
-                    days_since_epoch = (DBINT)(jdn - 2415021);
-                }
+                days_since_epoch = datetime_days_from_1900(utc_year,
+                                                           utc_month,
+                                                           utc_day);
 
                 /*
                     Time in 100-nanosecond ticks since midnight.
@@ -1642,7 +1683,32 @@ int datetime_to_sql(DBPROCESS* dbproc,
                 *tdstype = TDSDATETIMEOFFSET;
                 return (int)sizeof(DBDATETIMEALL);
             }
-        }    
+            else if (TDSDATETIME2 == *tdstype)
+            {
+                /*
+                    Naive datetimes with fractional seconds can likewise
+                    skip the string format/parse round-trip and fill in the
+                    DBDATETIMEALL struct directly with integer arithmetic.
+                */
+                DBDATETIMEALL* dtall = (DBDATETIMEALL*)converted;
+                dtall->time = (
+                        ((DBUBIGINT)hours * (DBUBIGINT)3600 +
+                        (DBUBIGINT)minutes * (DBUBIGINT)60 +
+                        (DBUBIGINT)seconds) * (DBUBIGINT)10000000 +
+                        (DBUBIGINT)useconds * (DBUBIGINT)10
+                    );
+                dtall->date = datetime_days_from_1900(PyDateTime_GET_YEAR_(o),
+                                                      PyDateTime_GET_MONTH_(o),
+                                                      PyDateTime_GET_DAY_(o));
+                dtall->offset     = 0;
+                dtall->time_prec  = 6; /* microsecond precision (Python's max) */
+                dtall->has_time   = 1;
+                dtall->has_date   = 1;
+                dtall->has_offset = 0;
+
+                return (int)sizeof(DBDATETIMEALL);
+            }
+        }
     }
     return (int)dbconvert(dbproc,
                           TDSCHAR,
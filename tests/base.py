@@ -123,18 +123,24 @@ class TestExternalDatabase(unittest.TestCase):
 
         return tuple(int(part) for part in version.split('.'))
 
+    # `ctds.freetds_version` is fixed for the life of the process; parse it
+    # once and share the result across all test cases.
+    _freetds_version = None
+
     @property
     def freetds_version(self):
-        matches = re.match(
-            r'^freetds v(?P<major>[\d]+)\.(?P<minor>[\d]+)(?:\.(?P<patch>[\d]+))?$',
-            ctds.freetds_version
-        )
-        assert matches is not None
-        return (
-            int(matches.group('major')),
-            int(matches.group('minor') or 0),
-            int(matches.group('patch') or 0),
-        )
+        if TestExternalDatabase._freetds_version is None:
+            matches = re.match(
+                r'^freetds v(?P<major>[\d]+)\.(?P<minor>[\d]+)(?:\.(?P<patch>[\d]+))?$',
+                ctds.freetds_version
+            )
+            assert matches is not None
+            TestExternalDatabase._freetds_version = (
+                int(matches.group('major')),
+                int(matches.group('minor') or 0),
+                int(matches.group('patch') or 0),
+            )
+        return TestExternalDatabase._freetds_version
 
     @property
     def use_sp_executesql(self):
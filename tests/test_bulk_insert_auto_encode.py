@@ -8,9 +8,13 @@ import unittest
 
 from k_ctds._bulk_insert import (
     _parse_table_name,
+    _chunked_encode_rows,
     _encode_rows,
     _get_column_codecs,
+    _get_column_codecs_bulk,
     _CODEPAGE_TO_CODEC,
+    _encode_column,
+    bulk_insert_columns,
 )
 from k_ctds._tds import SqlVarChar # pylint: disable=no-name-in-module
 
@@ -87,6 +91,13 @@ class TestParseTableName(unittest.TestCase):
             (None, None, 'unterminated')
         )
 
+    def test_memoized(self):
+        """Repeated parses of the same name return the cached tuple."""
+        self.assertIs(
+            _parse_table_name('dbo.MemoizedTable'),
+            _parse_table_name('dbo.MemoizedTable')
+        )
+
 class TestEncodeRows(unittest.TestCase):
 
     def test_sequence_row_encodes_by_position(self):
@@ -133,6 +144,18 @@ class TestEncodeRows(unittest.TestCase):
         self.assertEqual(result[0][0], '123')
         self.assertIsInstance(result[0][0], str)
 
+    def test_sequence_row_pre_encoded_values_pass_through(self):
+        """bytes and SqlVarChar values are treated as already encoded."""
+        by_position = ['utf-16-le', 'cp1252', 'cp1252']
+        by_name = {}
+        wrapped = SqlVarChar(b'wrapped')
+        rows = [(b'hello', bytearray(b'world'), wrapped)]
+
+        result = list(_encode_rows(rows, by_position, by_name))
+        self.assertEqual(result[0][0], b'hello')
+        self.assertEqual(result[0][1], bytearray(b'world'))
+        self.assertIs(result[0][2], wrapped)
+
     def test_dict_row_encodes_by_name(self):
         by_position = []
         by_name = {'Name': 'utf-16-le', 'Code': 'cp1252', 'Id': None}
@@ -196,6 +219,27 @@ class TestEncodeRows(unittest.TestCase):
         self.assertEqual(call_count[0], 1)
 
 
+class TestChunkedEncodeRows(unittest.TestCase):
+
+    def test_chunk_boundaries(self):
+        rows = [(i,) for i in range(5)]
+
+        chunks = list(_chunked_encode_rows(rows, [None], {}, chunk_size=2))
+        self.assertEqual(chunks, [[(0,), (1,)], [(2,), (3,)], [(4,)]])
+
+    def test_rows_are_encoded(self):
+        rows = [('a',), ('b',)]
+
+        chunks = list(_chunked_encode_rows(rows, ['cp1252'], {}, chunk_size=10))
+        self.assertEqual(len(chunks), 1)
+        for index, letter in enumerate(['a', 'b']):
+            self.assertIsInstance(chunks[0][index][0], SqlVarChar)
+            self.assertEqual(chunks[0][index][0].value, letter.encode('cp1252'))
+
+    def test_empty_rows(self):
+        self.assertEqual(list(_chunked_encode_rows([], [None], {})), [])
+
+
 class TestGetColumnCodecsNoResults(unittest.TestCase):
 
     def test_raises_on_empty_results(self):
@@ -205,9 +249,7 @@ class TestGetColumnCodecsNoResults(unittest.TestCase):
                 pass
             def fetchall(self):
                 return []
-            def __enter__(self):
-                return self
-            def __exit__(self, *args):
+            def close(self):
                 pass
 
         class FakeConnection:
@@ -221,6 +263,176 @@ class TestGetColumnCodecsNoResults(unittest.TestCase):
         self.assertIn('INFORMATION_SCHEMA', str(ctx.exception))
 
 
+class TestGetColumnCodecsBulk(unittest.TestCase):
+
+    @staticmethod
+    def _connection(rows):
+        class FakeCursor:
+            executed = []
+
+            def execute(self, query, params):
+                FakeCursor.executed.append((query, params))
+
+            def fetchall(self):
+                return rows
+
+            def close(self):
+                pass
+
+        class FakeConnection:
+            cursor_type = FakeCursor
+
+            def cursor(self):
+                return FakeCursor()
+
+        return FakeConnection()
+
+    def test_single_query_per_schema_group(self):
+        connection = self._connection([
+            ('TableA', 'Id', 'int', None),
+            ('TableA', 'Name', 'nvarchar', None),
+            ('TableB', 'Code', 'varchar', 1252),
+        ])
+
+        results = _get_column_codecs_bulk(connection, ['dbo.TableA', 'dbo.TableB'])
+
+        self.assertEqual(len(connection.cursor_type.executed), 1)
+        self.assertEqual(results['dbo.TableA'], ([None, 'utf-16-le'], {'Id': None, 'Name': 'utf-16-le'}))
+        self.assertEqual(results['dbo.TableB'], (['cp1252'], {'Code': 'cp1252'}))
+
+    def test_prefills_codec_cache(self):
+        connection = self._connection([
+            ('TableA', 'Name', 'nvarchar', None),
+        ])
+
+        results = _get_column_codecs_bulk(connection, ['TableA'])
+        # The single-table path should now be a cache hit and issue no query.
+        issued = len(connection.cursor_type.executed)
+        self.assertEqual(_get_column_codecs(connection, 'TableA'), results['TableA'])
+        self.assertEqual(len(connection.cursor_type.executed), issued)
+
+    def test_raises_on_missing_table(self):
+        connection = self._connection([
+            ('TableA', 'Name', 'nvarchar', None),
+        ])
+
+        with self.assertRaises(ValueError) as ctx:
+            _get_column_codecs_bulk(connection, ['TableA', 'NonExistentTable'])
+
+        self.assertIn('NonExistentTable', str(ctx.exception))
+
+
+class TestEncodeColumn(unittest.TestCase):
+
+    def test_no_codec_passthrough(self):
+        values = [1, 2, 3]
+        self.assertIs(_encode_column(values, None), values)
+
+    def test_batch_encode(self):
+        result = _encode_column(['a', 'b', '½'], 'cp1252')
+        self.assertEqual([value.value for value in result],
+                         [b'a', b'b', b'\xbd'])
+
+    def test_batch_encode_utf16(self):
+        # U+1F00 encodes to b'\x00\x1f'; adjacent to a following code
+        # unit's low byte this forms the same byte pattern as the encoded
+        # sentinel, but misaligned. The split must not break there.
+        result = _encode_column(['ἀ', 'x'], 'utf-16-le')
+        self.assertEqual([value.value for value in result],
+                         [b'\x00\x1f', b'x\x00'])
+
+    def test_sentinel_value_falls_back(self):
+        result = _encode_column(['a\x1fb'], 'cp1252')
+        self.assertEqual(result[0].value, b'a\x1fb')
+
+    def test_none_value_falls_back(self):
+        result = _encode_column(['a', None], 'cp1252')
+        self.assertEqual(result[0].value, b'a')
+        self.assertIsNone(result[1])
+
+    def test_empty(self):
+        self.assertEqual(_encode_column([], 'cp1252'), [])
+
+    def test_encode_error(self):
+        with self.assertRaises(UnicodeEncodeError):
+            _encode_column(['ok', 'ホ'], 'cp1252')
+
+
+class TestBulkInsertColumns(unittest.TestCase):
+
+    @staticmethod
+    def _connection(metadata):
+        class FakeCursor:
+            def execute(self, query, params):
+                pass
+
+            def fetchall(self):
+                return metadata
+
+            def close(self):
+                pass
+
+        class FakeConnection:
+            def cursor(self):
+                return FakeCursor()
+
+            def bulk_insert(self, table, rows, **kwargs):
+                self.inserted = [tuple(row) for row in rows]
+                self.kwargs = kwargs
+                return len(self.inserted)
+
+        return FakeConnection()
+
+    def test_columns_encoded_per_column(self):
+        connection = self._connection([
+            ('Id', 'int', None),
+            ('Name', 'nvarchar', None),
+            ('Code', 'varchar', 1252),
+        ])
+
+        inserted = bulk_insert_columns(connection, 'MyTable', {
+            'Id': [1, 2],
+            'Name': ['a', 'b'],
+            'Code': ['x', None],
+        })
+
+        self.assertEqual(inserted, 2)
+        rows = connection.inserted
+        self.assertEqual(rows[0][0], 1)
+        self.assertIsInstance(rows[0][1], SqlVarChar)
+        self.assertEqual(rows[0][1].value, 'a'.encode('utf-16-le'))
+        self.assertIsInstance(rows[0][2], SqlVarChar)
+        self.assertEqual(rows[0][2].value, b'x')
+        self.assertIsNone(rows[1][2])
+
+    def test_kwargs_passed_through(self):
+        connection = self._connection([('Id', 'int', None)])
+
+        bulk_insert_columns(
+            connection, 'MyTable', {'Id': [1]},
+            batch_size=10, auto_encode=True
+        )
+
+        # auto_encode is dropped; encoding already happened here.
+        self.assertEqual(connection.kwargs, {'batch_size': 10})
+
+    def test_empty_columns(self):
+        connection = self._connection([])
+        with self.assertRaises(ValueError):
+            bulk_insert_columns(connection, 'MyTable', {})
+
+    def test_mismatched_lengths(self):
+        connection = self._connection([
+            ('Id', 'int', None),
+            ('Name', 'nvarchar', None),
+        ])
+        with self.assertRaises(ValueError):
+            bulk_insert_columns(connection, 'MyTable', {
+                'Id': [1, 2],
+                'Name': ['a'],
+            })
+
+
 class TestCodePageMapping(unittest.TestCase):
 
     def test_common_code_pages_present(self):
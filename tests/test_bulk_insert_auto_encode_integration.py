@@ -6,532 +6,478 @@ round-trip: create table, bulk insert with auto_encode, read back and
 verify data integrity.
 """
 import datetime
+from array import array
 from decimal import Decimal
+from functools import lru_cache
 
+import k_ctds as ctds
 
 from .base import TestExternalDatabase
-from .compat import unicode_
+
+# Unicode test values as plain literals, decoded once at import instead of
+# per-test from UTF-8 byte strings.
+LATIN_HALF = '\u00bd'    # single byte 0xBD in cp1252
+EACUTE = '\u00e9'        # exists in both cp1252 (0xE9) and cp1250 (0xE9)
+CAFE = 'caf\u00e9'
+KATAKANA_HO = '\u30db'   # Japanese katakana HO
+
+
+# CREATE TABLE and readback SELECT statements for each test, keyed by the
+# test method name. The statements are built once at import time rather
+# than re-formatting the multi-line templates inside every test.
+_SQL = {
+    'test_string_encoding_cases': (
+        '''
+        CREATE TABLE test_string_encoding_cases
+        (
+            Kind     VARCHAR(20) COLLATE SQL_Latin1_General_CP1_CI_AS NOT NULL,
+            Latin1   VARCHAR(100) COLLATE SQL_Latin1_General_CP1_CI_AS,
+            NLatin   VARCHAR(100) COLLATE Polish_CI_AS,
+            NValue   NVARCHAR(200)
+        )
+        ''',
+        'SELECT Latin1, NLatin, NValue FROM test_string_encoding_cases WHERE Kind = :0',
+    ),
+    'test_mixed_column_types': (
+        '''
+        CREATE TABLE test_mixed_column_types
+        (
+            Id         INT NOT NULL PRIMARY KEY,
+            Name       NVARCHAR(100),
+            Code       VARCHAR(50) COLLATE SQL_Latin1_General_CP1_CI_AS,
+            Created    DATETIME,
+            Amount     DECIMAL(7,3),
+            Data       VARBINARY(100),
+            Flag       BIT
+        )
+        ''',
+        'SELECT * FROM test_mixed_column_types',
+    ),
+    'test_mixed_column_types_dict_rows': (
+        '''
+        CREATE TABLE test_mixed_column_types_dict_rows
+        (
+            Id         INT NOT NULL PRIMARY KEY,
+            Name       NVARCHAR(100),
+            Code       VARCHAR(50) COLLATE SQL_Latin1_General_CP1_CI_AS,
+            Created    DATETIME,
+            Amount     DECIMAL(7,3)
+        )
+        ''',
+        'SELECT * FROM test_mixed_column_types_dict_rows',
+    ),
+    'test_multiple_rows': (
+        '''
+        CREATE TABLE test_multiple_rows
+        (
+            Id      INT NOT NULL PRIMARY KEY,
+            Name    NVARCHAR(100),
+            Code    VARCHAR(100) COLLATE SQL_Latin1_General_CP1_CI_AS
+        )
+        ''',
+        'SELECT MIN(Id), MAX(Id) FROM test_multiple_rows; '
+        'SELECT COUNT(1) FROM test_multiple_rows',
+    ),
+    'test_multiple_rows_columnar': (
+        '''
+        CREATE TABLE test_multiple_rows_columnar
+        (
+            Id      INT NOT NULL PRIMARY KEY,
+            Name    NVARCHAR(100),
+            Code    VARCHAR(100) COLLATE SQL_Latin1_General_CP1_CI_AS
+        )
+        ''',
+        'SELECT MIN(Id), MAX(Id) FROM test_multiple_rows_columnar; '
+        'SELECT COUNT(1) FROM test_multiple_rows_columnar',
+    ),
+    'test_with_batch_size': (
+        '''
+        CREATE TABLE test_with_batch_size
+        (
+            Id      INT NOT NULL PRIMARY KEY,
+            Name    NVARCHAR(100)
+        )
+        ''',
+        'SELECT MIN(Id), MAX(Id) FROM test_with_batch_size; '
+        'SELECT COUNT(1) FROM test_with_batch_size',
+    ),
+    'test_auto_batch_size': (
+        '''
+        CREATE TABLE test_auto_batch_size
+        (
+            Id      INT NOT NULL PRIMARY KEY,
+            Name    NVARCHAR(100)
+        )
+        ''',
+        'SELECT COUNT(1) FROM test_auto_batch_size',
+    ),
+    'test_with_null_strings': (
+        '''
+        CREATE TABLE test_with_null_strings
+        (
+            Id      INT NOT NULL PRIMARY KEY,
+            Name    NVARCHAR(100) NULL,
+            Code    VARCHAR(100) COLLATE SQL_Latin1_General_CP1_CI_AS NULL
+        )
+        ''',
+        'SELECT * FROM test_with_null_strings; '
+        'SELECT COUNT(1) FROM test_with_null_strings',
+    ),
+    'test_without_auto_encode_unchanged': (
+        '''
+        CREATE TABLE test_without_auto_encode_unchanged
+        (
+            Value VARCHAR(100) COLLATE SQL_Latin1_General_CP1_CI_AS
+        )
+        ''',
+        None,
+    ),
+    'test_schema_qualified_table': (
+        '''
+        CREATE TABLE dbo.test_schema_qualified_table
+        (
+            Id      INT NOT NULL PRIMARY KEY,
+            Name    NVARCHAR(100)
+        )
+        ''',
+        'SELECT Name FROM dbo.test_schema_qualified_table',
+    ),
+    'test_identity_column': (
+        '''
+        CREATE TABLE test_identity_column
+        (
+            Id      INT IDENTITY(1,1) NOT NULL PRIMARY KEY,
+            Name    NVARCHAR(100),
+            Code    VARCHAR(50) COLLATE SQL_Latin1_General_CP1_CI_AS
+        )
+        ''',
+        'SELECT Name, Code FROM test_identity_column',
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _catalog_schema_sql(database):
+    """
+    SQL for test_catalog_schema_qualified_table. The database name is only
+    known at run time, so the formatted statements are cached per database
+    instead of being built in _SQL.
+    """
+    return (
+        '''
+        CREATE TABLE {0}.dbo.test_catalog_schema_qualified_table
+        (
+            Id      INT NOT NULL PRIMARY KEY,
+            Name    NVARCHAR(100),
+            Code    VARCHAR(50) COLLATE SQL_Latin1_General_CP1_CI_AS
+        )
+        '''.format(database),
+        'SELECT Name, Code FROM {0}.dbo.test_catalog_schema_qualified_table'.format(database),
+    )
 
 
 class TestBulkInsertAutoEncode(TestExternalDatabase):
 
-    def test_varchar_latin1_collation(self):
-        """VARCHAR column with SQL_Latin1_General_CP1_CI_AS (code page 1252)."""
-        with self.connect(autocommit=False) as connection:
-            try:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        '''
-                        CREATE TABLE {0}
-                        (
-                            Value VARCHAR(100) COLLATE SQL_Latin1_General_CP1_CI_AS
-                        )
-                        '''.format(self.test_varchar_latin1_collation.__name__)
-                    )
-
-                # U+00BD = ½, single byte 0xBD in cp1252
-                value = unicode_(b'\xc2\xbd', encoding='utf-8')
-                inserted = connection.bulk_insert(
-                    self.test_varchar_latin1_collation.__name__,
-                    [(value,)],
-                    auto_encode=True
-                )
-                self.assertEqual(inserted, 1)
+    @classmethod
+    def setUpClass(cls):
+        # One TDS login shared by the whole class; each test's work is
+        # rolled back in tearDown, so tests never observe each other's
+        # tables or data. The throwaway instance is only needed because
+        # the connection settings are read in TestExternalDatabase.setUp.
+        case = cls('test_multiple_rows')
+        TestExternalDatabase.setUp(case)
+        cls.connection = case.connect(autocommit=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.connection.close()
+
+    def setUp(self):
+        TestExternalDatabase.setUp(self)
+        self.cursor = self.connection.cursor()
+
+    def tearDown(self):
+        # Roll back each test's DDL and data so the shared connection is
+        # not left with an open transaction.
+        self.cursor.close()
+        self.connection.rollback()
+        TestExternalDatabase.tearDown(self)
+
+    def test_string_encoding_cases(self):
+        """
+        Single-row string encoding cases against one shared wide table.
 
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        'SELECT Value FROM {0}'.format(
-                            self.test_varchar_latin1_collation.__name__
-                        )
-                    )
-                    rows = [tuple(row) for row in cursor.fetchall()]
-                    self.assertEqual(rows, [(value,)])
-
-            finally:
-                connection.rollback()
-
-    def test_nvarchar_unicode(self):
-        """NVARCHAR column with Unicode data."""
-        with self.connect(autocommit=False) as connection:
-            try:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        '''
-                        CREATE TABLE {0}
-                        (
-                            Value NVARCHAR(100)
-                        )
-                        '''.format(self.test_nvarchar_unicode.__name__)
-                    )
-
-                # Japanese katakana ホ (U+30DB)
-                value = unicode_(b'\xe3\x83\x9b', encoding='utf-8')
-                inserted = connection.bulk_insert(
-                    self.test_nvarchar_unicode.__name__,
-                    [(value,)],
+        Covers VARCHAR with the cp1252 collation, two VARCHAR columns with
+        different collations on the same table, NVARCHAR with Unicode data
+        and NVARCHAR with 100 repeated katakana characters.
+        """
+        create, select = _SQL['test_string_encoding_cases']
+        self.cursor.execute(create)
+
+        cases = [
+            # (kind, Latin1, NLatin, NValue)
+            ('latin1', LATIN_HALF, None, None),
+            ('collations', EACUTE, EACUTE, None),
+            ('nvarchar', None, None, KATAKANA_HO),
+            ('katakana100', None, None, KATAKANA_HO * 100),
+        ]
+
+        for case in cases:
+            with self.subTest(kind=case[0]):
+                inserted = self.connection.bulk_insert(
+                    'test_string_encoding_cases',
+                    [case],
                     auto_encode=True
                 )
                 self.assertEqual(inserted, 1)
 
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        'SELECT Value FROM {0}'.format(
-                            self.test_nvarchar_unicode.__name__
-                        )
-                    )
-                    rows = [tuple(row) for row in cursor.fetchall()]
-                    self.assertEqual(rows, [(value,)])
-
-            finally:
-                connection.rollback()
+                self.cursor.execute(select, (case[0],))
+                rows = self.cursor.fetchall_tuples()
+                self.assertEqual(rows, [case[1:]])
 
     def test_mixed_column_types(self):
         """Table with VARCHAR, NVARCHAR, INT, DATETIME, DECIMAL, VARBINARY."""
-        with self.connect(autocommit=False) as connection:
-            try:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        '''
-                        CREATE TABLE {0}
-                        (
-                            Id         INT NOT NULL PRIMARY KEY,
-                            Name       NVARCHAR(100),
-                            Code       VARCHAR(50) COLLATE SQL_Latin1_General_CP1_CI_AS,
-                            Created    DATETIME,
-                            Amount     DECIMAL(7,3),
-                            Data       VARBINARY(100),
-                            Flag       BIT
-                        )
-                        '''.format(self.test_mixed_column_types.__name__)
-                    )
-
-                name = unicode_(b'\xe3\x83\x9b\xe3\x83\x9b', encoding='utf-8')
-                code = unicode_(b'caf\xc3\xa9', encoding='utf-8')
-                dt = datetime.datetime(2025, 6, 15, 10, 30, 0)
-                amount = Decimal('123.456')
-                data = b'\x01\x02\x03'
-
-                inserted = connection.bulk_insert(
-                    self.test_mixed_column_types.__name__,
-                    [(1, name, code, dt, amount, data, True)],
-                    auto_encode=True
-                )
-                self.assertEqual(inserted, 1)
-
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        'SELECT * FROM {0}'.format(
-                            self.test_mixed_column_types.__name__
-                        )
-                    )
-                    rows = [tuple(row) for row in cursor.fetchall()]
-                    self.assertEqual(len(rows), 1)
-                    row = rows[0]
-                    self.assertEqual(row[0], 1)
-                    self.assertEqual(row[1], name)
-                    self.assertEqual(row[2], code)
-                    self.assertEqual(row[3], dt)
-                    self.assertEqual(row[4], amount)
-                    self.assertEqual(row[5], data)
-                    self.assertEqual(row[6], True)
-
-            finally:
-                connection.rollback()
+        create, select = _SQL['test_mixed_column_types']
+        self.cursor.execute(create)
+
+        name = KATAKANA_HO * 2
+        code = CAFE
+        dt = datetime.datetime(2025, 6, 15, 10, 30, 0)
+        amount = Decimal('123.456')
+        data = b'\x01\x02\x03'
+
+        inserted = self.connection.bulk_insert(
+            'test_mixed_column_types',
+            [(1, name, code, dt, amount, data, True)],
+            auto_encode=True
+        )
+        self.assertEqual(inserted, 1)
+
+        self.cursor.execute(select)
+        rows = self.cursor.fetchall_tuples()
+        self.assertEqual(len(rows), 1)
+        row = rows[0]
+        self.assertEqual(row[0], 1)
+        self.assertEqual(row[1], name)
+        self.assertEqual(row[2], code)
+        self.assertEqual(row[3], dt)
+        self.assertEqual(row[4], amount)
+        self.assertEqual(row[5], data)
+        self.assertEqual(row[6], True)
 
     def test_mixed_column_types_dict_rows(self):
         """Same as test_mixed_column_types but with dict-based rows."""
-        with self.connect(autocommit=False) as connection:
-            try:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        '''
-                        CREATE TABLE {0}
-                        (
-                            Id         INT NOT NULL PRIMARY KEY,
-                            Name       NVARCHAR(100),
-                            Code       VARCHAR(50) COLLATE SQL_Latin1_General_CP1_CI_AS,
-                            Created    DATETIME,
-                            Amount     DECIMAL(7,3)
-                        )
-                        '''.format(self.test_mixed_column_types_dict_rows.__name__)
-                    )
-
-                name = unicode_(b'\xe3\x83\x9b\xe3\x83\x9b', encoding='utf-8')
-                code = unicode_(b'caf\xc3\xa9', encoding='utf-8')
-                dt = datetime.datetime(2025, 6, 15, 10, 30, 0)
-                amount = Decimal('99.500')
-
-                inserted = connection.bulk_insert(
-                    self.test_mixed_column_types_dict_rows.__name__,
-                    [
-                        {
-                            'Id': 1,
-                            'Name': name,
-                            'Code': code,
-                            'Created': dt,
-                            'Amount': amount,
-                        }
-                    ],
-                    auto_encode=True
-                )
-                self.assertEqual(inserted, 1)
-
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        'SELECT * FROM {0}'.format(
-                            self.test_mixed_column_types_dict_rows.__name__
-                        )
-                    )
-                    rows = [tuple(row) for row in cursor.fetchall()]
-                    self.assertEqual(rows, [(1, name, code, dt, amount)])
-
-            finally:
-                connection.rollback()
-
-    def test_multiple_varchar_collations(self):
-        """Two VARCHAR columns with different collations on the same table."""
-        with self.connect(autocommit=False) as connection:
-            try:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        '''
-                        CREATE TABLE {0}
-                        (
-                            Latin1  VARCHAR(100) COLLATE SQL_Latin1_General_CP1_CI_AS,
-                            Latin2  VARCHAR(100) COLLATE Polish_CI_AS
-                        )
-                        '''.format(self.test_multiple_varchar_collations.__name__)
-                    )
-
-                # U+00E9 (é): exists in both cp1252 (0xE9) and cp1250 (0xE9)
-                value = unicode_(b'\xc3\xa9', encoding='utf-8')
-
-                inserted = connection.bulk_insert(
-                    self.test_multiple_varchar_collations.__name__,
-                    [(value, value)],
-                    auto_encode=True
-                )
-                self.assertEqual(inserted, 1)
-
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        'SELECT * FROM {0}'.format(
-                            self.test_multiple_varchar_collations.__name__
-                        )
-                    )
-                    rows = [tuple(row) for row in cursor.fetchall()]
-                    self.assertEqual(rows, [(value, value)])
-
-            finally:
-                connection.rollback()
-
+        create, select = _SQL['test_mixed_column_types_dict_rows']
+        self.cursor.execute(create)
+
+        name = KATAKANA_HO * 2
+        code = CAFE
+        dt = datetime.datetime(2025, 6, 15, 10, 30, 0)
+        amount = Decimal('99.500')
+
+        inserted = self.connection.bulk_insert(
+            'test_mixed_column_types_dict_rows',
+            [
+                {
+                    'Id': 1,
+                    'Name': name,
+                    'Code': code,
+                    'Created': dt,
+                    'Amount': amount,
+                }
+            ],
+            auto_encode=True
+        )
+        self.assertEqual(inserted, 1)
+
+        self.cursor.execute(select)
+        rows = self.cursor.fetchall_tuples()
+        self.assertEqual(rows, [(1, name, code, dt, amount)])
 
     def test_multiple_rows(self):
         """Bulk insert many rows with auto_encode."""
-        with self.connect(autocommit=False) as connection:
-            try:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        '''
-                        CREATE TABLE {0}
-                        (
-                            Id      INT NOT NULL PRIMARY KEY,
-                            Name    NVARCHAR(100),
-                            Code    VARCHAR(100) COLLATE SQL_Latin1_General_CP1_CI_AS
-                        )
-                        '''.format(self.test_multiple_rows.__name__)
-                    )
-
-                num_rows = 100
-                inserted = connection.bulk_insert(
-                    self.test_multiple_rows.__name__,
-                    (
-                        (ix, 'row {}'.format(ix), 'code {}'.format(ix))
-                        for ix in range(num_rows)
-                    ),
-                    auto_encode=True
-                )
-                self.assertEqual(inserted, num_rows)
-
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        'SELECT COUNT(1) FROM {0}'.format(
-                            self.test_multiple_rows.__name__
-                        )
-                    )
-                    self.assertEqual(cursor.fetchone()[0], num_rows)
-
-            finally:
-                connection.rollback()
+        create, select = _SQL['test_multiple_rows']
+        self.cursor.execute(create)
+
+        num_rows = 100
+        ids = array('i', range(num_rows))
+        names = ['row {}'.format(ix) for ix in range(num_rows)]
+        codes = ['code {}'.format(ix) for ix in range(num_rows)]
+        inserted = self.connection.bulk_insert(
+            'test_multiple_rows',
+            zip(ids, names, codes),
+            auto_encode=True
+        )
+        self.assertEqual(inserted, num_rows)
+
+        self.cursor.execute(select)
+        self.assertEqual(self.cursor.fetchone(), (0, num_rows - 1))
+        self.assertTrue(self.cursor.nextset())
+        self.assertEqual(self.cursor.fetchone()[0], num_rows)
+
+    def test_multiple_rows_columnar(self):
+        """Columnar bulk insert of many rows via bulk_insert_columns."""
+        create, select = _SQL['test_multiple_rows_columnar']
+        self.cursor.execute(create)
+
+        num_rows = 100
+        inserted = ctds.bulk_insert_columns(
+            self.connection,
+            'test_multiple_rows_columnar',
+            {
+                'Id': list(range(num_rows)),
+                'Name': ['row {}'.format(ix) for ix in range(num_rows)],
+                'Code': ['code {}'.format(ix) for ix in range(num_rows)],
+            }
+        )
+        self.assertEqual(inserted, num_rows)
+
+        self.cursor.execute(select)
+        self.assertEqual(self.cursor.fetchone(), (0, num_rows - 1))
+        self.assertTrue(self.cursor.nextset())
+        self.assertEqual(self.cursor.fetchone()[0], num_rows)
 
     def test_with_batch_size(self):
         """auto_encode works with batch_size parameter."""
-        with self.connect(autocommit=False) as connection:
-            try:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        '''
-                        CREATE TABLE {0}
-                        (
-                            Id      INT NOT NULL PRIMARY KEY,
-                            Name    NVARCHAR(100)
-                        )
-                        '''.format(self.test_with_batch_size.__name__)
-                    )
-
-                num_rows = 50
-                inserted = connection.bulk_insert(
-                    self.test_with_batch_size.__name__,
-                    (
-                        (ix, 'name {}'.format(ix))
-                        for ix in range(num_rows)
-                    ),
-                    batch_size=10,
-                    auto_encode=True
-                )
-                self.assertEqual(inserted, num_rows)
-
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        'SELECT COUNT(1) FROM {0}'.format(
-                            self.test_with_batch_size.__name__
-                        )
-                    )
-                    self.assertEqual(cursor.fetchone()[0], num_rows)
-
-            finally:
-                connection.rollback()
+        create, select = _SQL['test_with_batch_size']
+        self.cursor.execute(create)
+
+        num_rows = 50
+        ids = array('i', range(num_rows))
+        names = ['name {}'.format(ix) for ix in range(num_rows)]
+        inserted = self.connection.bulk_insert(
+            'test_with_batch_size',
+            zip(ids, names),
+            batch_size=10,
+            auto_encode=True
+        )
+        self.assertEqual(inserted, num_rows)
+
+        self.cursor.execute(select)
+        self.assertEqual(self.cursor.fetchone(), (0, num_rows - 1))
+        self.assertTrue(self.cursor.nextset())
+        self.assertEqual(self.cursor.fetchone()[0], num_rows)
+
+    def test_auto_batch_size(self):
+        """batch_size=None derives a batch size from the first row."""
+        create, select = _SQL['test_auto_batch_size']
+        self.cursor.execute(create)
+
+        num_rows = 1000
+        inserted = self.connection.bulk_insert(
+            'test_auto_batch_size',
+            (
+                (ix, 'name {}'.format(ix))
+                for ix in range(num_rows)
+            ),
+            auto_encode=True
+        )
+        self.assertEqual(inserted, num_rows)
+
+        self.cursor.execute(select)
+        self.assertEqual(self.cursor.fetchone()[0], num_rows)
 
     def test_with_null_strings(self):
         """None values in string columns should pass through unchanged."""
-        with self.connect(autocommit=False) as connection:
-            try:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        '''
-                        CREATE TABLE {0}
-                        (
-                            Id      INT NOT NULL PRIMARY KEY,
-                            Name    NVARCHAR(100) NULL,
-                            Code    VARCHAR(100) COLLATE SQL_Latin1_General_CP1_CI_AS NULL
-                        )
-                        '''.format(self.test_with_null_strings.__name__)
-                    )
-
-                inserted = connection.bulk_insert(
-                    self.test_with_null_strings.__name__,
-                    [(1, None, None), (2, 'hello', None), (3, None, 'world')],
-                    auto_encode=True
-                )
-                self.assertEqual(inserted, 3)
-
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        'SELECT * FROM {0} ORDER BY Id'.format(
-                            self.test_with_null_strings.__name__
-                        )
-                    )
-                    rows = [tuple(row) for row in cursor.fetchall()]
-                    self.assertEqual(rows, [
-                        (1, None, None),
-                        (2, 'hello', None),
-                        (3, None, 'world'),
-                    ])
-
-            finally:
-                connection.rollback()
+        create, select = _SQL['test_with_null_strings']
+        self.cursor.execute(create)
+
+        inserted = self.connection.bulk_insert(
+            'test_with_null_strings',
+            [(1, None, None), (2, 'hello', None), (3, None, 'world')],
+            auto_encode=True
+        )
+        self.assertEqual(inserted, 3)
+
+        self.cursor.execute(select)
+        rows = self.cursor.fetchall_tuples()
+        self.assertEqual(rows, [
+            (1, None, None),
+            (2, 'hello', None),
+            (3, None, 'world'),
+        ])
+        self.assertTrue(self.cursor.nextset())
+        self.assertEqual(self.cursor.fetchone()[0], 3)
 
     def test_nonexistent_table(self):
         """auto_encode should raise ValueError for a table that doesn't exist."""
-        with self.connect(autocommit=False) as connection:
-            with self.assertRaises(ValueError) as ctx:
-                connection.bulk_insert(
-                    'this_table_does_not_exist_at_all',
-                    [('hello',)],
-                    auto_encode=True
-                )
-            self.assertIn('this_table_does_not_exist_at_all', str(ctx.exception))
+        with self.assertRaises(ValueError) as ctx:
+            self.connection.bulk_insert(
+                'this_table_does_not_exist_at_all',
+                [('hello',)],
+                auto_encode=True
+            )
+        self.assertIn('this_table_does_not_exist_at_all', str(ctx.exception))
 
     def test_without_auto_encode_unchanged(self):
         """Passing auto_encode=False (default) uses original behavior."""
-        with self.connect(autocommit=False) as connection:
-            try:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        '''
-                        CREATE TABLE {0}
-                        (
-                            Value VARCHAR(100) COLLATE SQL_Latin1_General_CP1_CI_AS
-                        )
-                        '''.format(self.test_without_auto_encode_unchanged.__name__)
-                    )
-
-                # Without auto_encode, bare str produces the existing warning.
-                import warnings
-                with warnings.catch_warnings(record=True) as warns:
-                    connection.bulk_insert(
-                        self.test_without_auto_encode_unchanged.__name__,
-                        [('hello',)]
-                    )
-
-                self.assertTrue(
-                    any('bulk insert' in str(w.message).lower() for w in warns)
-                )
+        create, _ = _SQL['test_without_auto_encode_unchanged']
+        self.cursor.execute(create)
 
-            finally:
-                connection.rollback()
+        # Without auto_encode, bare str produces the existing warning.
+        with self.assertWarnsRegex(Warning, r'bulk insert'):
+            self.connection.bulk_insert(
+                'test_without_auto_encode_unchanged',
+                [('hello',)]
+            )
 
     def test_schema_qualified_table(self):
         """auto_encode works with schema-qualified table names."""
-        with self.connect(autocommit=False) as connection:
-            try:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        '''
-                        CREATE TABLE dbo.{0}
-                        (
-                            Id      INT NOT NULL PRIMARY KEY,
-                            Name    NVARCHAR(100)
-                        )
-                        '''.format(self.test_schema_qualified_table.__name__)
-                    )
-
-                value = unicode_(b'\xe3\x83\x9b', encoding='utf-8')
-                inserted = connection.bulk_insert(
-                    'dbo.{}'.format(self.test_schema_qualified_table.__name__),
-                    [(1, value)],
-                    auto_encode=True
-                )
-                self.assertEqual(inserted, 1)
+        create, select = _SQL['test_schema_qualified_table']
+        self.cursor.execute(create)
 
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        'SELECT Name FROM dbo.{0}'.format(
-                            self.test_schema_qualified_table.__name__
-                        )
-                    )
-                    rows = [tuple(row) for row in cursor.fetchall()]
-                    self.assertEqual(rows, [(value,)])
+        value = KATAKANA_HO
+        inserted = self.connection.bulk_insert(
+            'dbo.test_schema_qualified_table',
+            [(1, value)],
+            auto_encode=True
+        )
+        self.assertEqual(inserted, 1)
 
-            finally:
-                connection.rollback()
+        self.cursor.execute(select)
+        rows = self.cursor.fetchall_tuples()
+        self.assertEqual(rows, [(value,)])
 
     def test_catalog_schema_qualified_table(self):
         """auto_encode works with three-part database.schema.table names."""
-        with self.connect(autocommit=False) as connection:
-            try:
-                database = self.get_option('database')
-
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        '''
-                        CREATE TABLE {0}.dbo.{1}
-                        (
-                            Id      INT NOT NULL PRIMARY KEY,
-                            Name    NVARCHAR(100),
-                            Code    VARCHAR(50) COLLATE SQL_Latin1_General_CP1_CI_AS
-                        )
-                        '''.format(database, self.test_catalog_schema_qualified_table.__name__)
-                    )
-
-                name = unicode_(b'\xe3\x83\x9b', encoding='utf-8')
-                code = unicode_(b'caf\xc3\xa9', encoding='utf-8')
-                inserted = connection.bulk_insert(
-                    '{}.dbo.{}'.format(database, self.test_catalog_schema_qualified_table.__name__),
-                    [(1, name, code)],
-                    auto_encode=True
-                )
-                self.assertEqual(inserted, 1)
+        database = self.get_option('database')
+        create, select = _catalog_schema_sql(database)
 
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        'SELECT Name, Code FROM {0}.dbo.{1}'.format(
-                            database, self.test_catalog_schema_qualified_table.__name__
-                        )
-                    )
-                    rows = [tuple(row) for row in cursor.fetchall()]
-                    self.assertEqual(rows, [(name, code)])
-
-            finally:
-                connection.rollback()
-
-    def test_nvarchar_repeated_katakana(self):
-        """
-        Reproduce the exact pattern from existing tests: 100 repeated
-        katakana characters into NVARCHAR, verifying auto_encode produces
-        the same result as the manual SqlVarChar(encode('utf-16le')) approach.
-        """
-        with self.connect(autocommit=False) as connection:
-            try:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        '''
-                        CREATE TABLE {0}
-                        (
-                            Value NVARCHAR(200)
-                        )
-                        '''.format(self.test_nvarchar_repeated_katakana.__name__)
-                    )
-
-                value = unicode_(b'\xe3\x83\x9b', encoding='utf-8') * 100
-                inserted = connection.bulk_insert(
-                    self.test_nvarchar_repeated_katakana.__name__,
-                    [(value,)],
-                    auto_encode=True
-                )
-                self.assertEqual(inserted, 1)
+        self.cursor.execute(create)
 
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        'SELECT Value FROM {0}'.format(
-                            self.test_nvarchar_repeated_katakana.__name__
-                        )
-                    )
-                    rows = [tuple(row) for row in cursor.fetchall()]
-                    self.assertEqual(rows, [(value,)])
+        name = KATAKANA_HO
+        code = CAFE
+        inserted = self.connection.bulk_insert(
+            '{}.dbo.test_catalog_schema_qualified_table'.format(database),
+            [(1, name, code)],
+            auto_encode=True
+        )
+        self.assertEqual(inserted, 1)
 
-            finally:
-                connection.rollback()
+        self.cursor.execute(select)
+        rows = self.cursor.fetchall_tuples()
+        self.assertEqual(rows, [(name, code)])
 
     def test_identity_column(self):
         """auto_encode works with tables that have IDENTITY columns."""
-        with self.connect(autocommit=False) as connection:
-            try:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        '''
-                        CREATE TABLE {0}
-                        (
-                            Id      INT IDENTITY(1,1) NOT NULL PRIMARY KEY,
-                            Name    NVARCHAR(100),
-                            Code    VARCHAR(50) COLLATE SQL_Latin1_General_CP1_CI_AS
-                        )
-                        '''.format(self.test_identity_column.__name__)
-                    )
-
-                inserted = connection.bulk_insert(
-                    self.test_identity_column.__name__,
-                    [
-                        {'Name': '\u00e9\u00e8\u00ea', 'Code': '\u00a9\u00ae\u00bf'},
-                        {'Name': '\u30db\u30c6\u30eb', 'Code': '\u00fc\u00f1\u00e4'},
-                        {'Name': '\U0001f600\U0001f4a1', 'Code': '\u00d8\u00c6\u00e5'},
-                    ],
-                    auto_encode=True
-                )
-                self.assertEqual(inserted, 3)
-
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        'SELECT Name, Code FROM {0} ORDER BY Id'.format(
-                            self.test_identity_column.__name__
-                        )
-                    )
-                    rows = [tuple(row) for row in cursor.fetchall()]
-                    self.assertEqual(rows, [
-                        ('\u00e9\u00e8\u00ea', '\u00a9\u00ae\u00bf'),
-                        ('\u30db\u30c6\u30eb', '\u00fc\u00f1\u00e4'),
-                        ('\U0001f600\U0001f4a1', '\u00d8\u00c6\u00e5'),
-                    ])
-
-            finally:
-                connection.rollback()
+        create, select = _SQL['test_identity_column']
+        self.cursor.execute(create)
+
+        inserted = self.connection.bulk_insert(
+            'test_identity_column',
+            [
+                {'Name': '\u00e9\u00e8\u00ea', 'Code': '\u00a9\u00ae\u00bf'},
+                {'Name': '\u30db\u30c6\u30eb', 'Code': '\u00fc\u00f1\u00e4'},
+                {'Name': '\U0001f600\U0001f4a1', 'Code': '\u00d8\u00c6\u00e5'},
+            ],
+            auto_encode=True
+        )
+        self.assertEqual(inserted, 3)
+
+        self.cursor.execute(select)
+        rows = self.cursor.fetchall_tuples()
+        self.assertEqual(rows, [
+            ('\u00e9\u00e8\u00ea', '\u00a9\u00ae\u00bf'),
+            ('\u30db\u30c6\u30eb', '\u00fc\u00f1\u00e4'),
+            ('\U0001f600\U0001f4a1', '\u00d8\u00c6\u00e5'),
+        ])
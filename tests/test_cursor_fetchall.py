@@ -62,10 +62,11 @@ sequence of sequences.
                     '''.format(self.test_fetchall.__name__)
                 )
                 self.assertEqual([tuple(row) for row in cursor.fetchall()], [(1,), (2,), (3,)])
-                self.assertEqual(list(cursor.fetchall()), [])
+                self.assertTrue(cursor.exhausted)
                 self.assertEqual(cursor.nextset(), True)
+                self.assertFalse(cursor.exhausted)
                 self.assertEqual([tuple(row) for row in cursor.fetchall()], [(2,), (4,), (6,)])
-                self.assertEqual(list(cursor.fetchall()), [])
+                self.assertTrue(cursor.exhausted)
                 self.assertEqual(cursor.nextset(), None)
                 self.assertRaises(ctds.InterfaceError, cursor.fetchall)
 
@@ -82,6 +83,26 @@ sequence of sequences.
                 self.assertEqual(list(cursor.fetchall()), [])
                 self.assertEqual(cursor.nextset(), None)
 
+    def test_fetchall_columns(self):
+        with self.connect() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    '''
+                        DECLARE @{0} TABLE(i INT);
+                        INSERT INTO @{0}(i) VALUES (1),(2),(3);
+                        SELECT i FROM @{0};
+                        SELECT i AS j, i * 2 FROM @{0};
+                    '''.format(self.test_fetchall_columns.__name__)
+                )
+                self.assertEqual(cursor.fetchall_columns(), {'i': [1, 2, 3]})
+                self.assertTrue(cursor.exhausted)
+                self.assertEqual(cursor.nextset(), True)
+                self.assertEqual(
+                    cursor.fetchall_columns(),
+                    {'j': [1, 2, 3], 1: [2, 4, 6]}
+                )
+                self.assertEqual(cursor.nextset(), None)
+
     def test_multiple_resultsets(self):
         with self.connect() as connection:
             with connection.cursor() as cursor:
@@ -98,11 +119,11 @@ sequence of sequences.
                 self.assertEqual(list(cursor.fetchall()), [])
                 self.assertEqual(cursor.nextset(), True)
                 self.assertEqual([tuple(row) for row in cursor.fetchall()], [(3,)])
-                self.assertEqual(list(cursor.fetchall()), [])
+                self.assertTrue(cursor.exhausted)
                 self.assertEqual(cursor.nextset(), True)
                 self.assertEqual(list(cursor.fetchall()), [])
                 self.assertEqual(cursor.nextset(), True)
-                self.assertEqual([tuple(row) for row in cursor.fetchall()], [(1,), (2,), (3,)])
+                self.assertEqual(cursor.fetchall_columns(), {'ii': [1, 2, 3]})
                 self.assertEqual(cursor.nextset(), None)
 
 class TestCursorFetchallWarningAsError(TestExternalDatabase):
@@ -7,23 +7,69 @@ to Python datetime objects with timezone information.
 from datetime import datetime, timezone, timedelta
 import unittest
 
+import pytest
+
 import k_ctds as ctds
 
 from .base import TestExternalDatabase
 
+# Keep the whole module on one pytest-xdist worker so the class-scoped
+# connection (and its session temp table) is not split across workers.
+pytestmark = [pytest.mark.xdist_group('dto_read')]
+
+# Offset cases with the expected utcoffset constructed once at import
+# time instead of per test run.
+_OFFSET_CASES = (
+    ('2024-01-01 00:00:00.0000000 +00:00', timedelta(0)),
+    ('2024-01-01 00:00:00.0000000 +01:00', timedelta(hours=1)),
+    ('2024-01-01 00:00:00.0000000 -08:00', timedelta(hours=-8)),
+    ('2024-01-01 00:00:00.0000000 +09:30', timedelta(hours=9, minutes=30)),
+    ('2024-01-01 00:00:00.0000000 -03:30', timedelta(hours=-3, minutes=-30)),
+    ('2024-01-01 00:00:00.0000000 +12:00', timedelta(hours=12)),
+    ('2024-01-01 00:00:00.0000000 -12:00', timedelta(hours=-12)),
+    ('2024-01-01 00:00:00.0000000 +14:00', timedelta(hours=14)),
+)
+
 
 class TestDateTimeOffsetRead(TestExternalDatabase):
     """Test reading DATETIMEOFFSET values from SQL Server."""
 
+    @classmethod
+    def setUpClass(cls):
+        # One TDS login shared by the whole class; each test only opens
+        # a cursor. The throwaway instance is only needed because the
+        # connection settings are read in TestExternalDatabase.setUp.
+        case = cls('test_datetimeoffset_null')
+        TestExternalDatabase.setUp(case)
+        cls.connection = case.connect()
+
+        # The session-scoped temp table is created once here; the table
+        # test resets it with TRUNCATE instead of paying tempdb DDL.
+        with cls.connection.cursor() as cursor:
+            cursor.execute(
+                '''
+                CREATE TABLE #test_dto (
+                    id INT,
+                    event_time DATETIMEOFFSET
+                )
+                '''
+            )
+
+        # These tests fully consume every result set, so one cursor can
+        # be shared by the whole class instead of opened per test.
+        cls.shared_cursor = cls.connection.cursor()
+        # Size fetchmany batches for the multi-row tests instead of the
+        # DB API default of 1.
+        cls.shared_cursor.arraysize = 64
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.shared_cursor.close()
+        cls.connection.close()
+
     def setUp(self):
         TestExternalDatabase.setUp(self)
-        self.connection = self.connect()
-        self.cursor = self.connection.cursor()
-
-    def tearDown(self):
-        self.cursor.close()
-        self.connection.close()
-        TestExternalDatabase.tearDown(self)
+        self.cursor = self.shared_cursor
 
     def test_datetimeoffset_null(self):
         """Test reading NULL DATETIMEOFFSET value."""
@@ -33,62 +79,67 @@ class TestDateTimeOffsetRead(TestExternalDatabase):
 
     def test_datetimeoffset_utc(self):
         """Test reading DATETIMEOFFSET with UTC timezone."""
+        # Bind the aware datetime directly; the CAST pins the parameter
+        # type so the round-trip uses the binary DATETIMEOFFSET wire
+        # format instead of server-side string parsing.
+        expected = datetime(2024, 1, 15, 12, 30, 45, 123456, tzinfo=timezone.utc)
         self.cursor.execute(
-            "SELECT CONVERT(DATETIMEOFFSET, '2024-01-15 12:30:45.1234567 +00:00')"
+            'SELECT CAST(:0 AS DATETIMEOFFSET)',
+            (expected,)
         )
         result = self.cursor.fetchone()[0]
-        
-        expected = datetime(2024, 1, 15, 12, 30, 45, 123456, tzinfo=timezone.utc)
+
         self.assertEqual(result, expected)
-        self.assertEqual(result.tzinfo, timezone.utc)
+        # The driver interns the UTC singleton for zero offsets.
+        self.assertIs(result.tzinfo, timezone.utc)
 
     def test_datetimeoffset_positive_offset(self):
         """Test reading DATETIMEOFFSET with positive timezone offset."""
-        # Test +05:30 (India Standard Time)
+        # Test +05:30 (India Standard Time); the bound aware datetime
+        # round-trips in the binary DATETIMEOFFSET wire format.
+        expected_tz = timezone(timedelta(hours=5, minutes=30))
+        expected = datetime(2024, 3, 20, 14, 15, 30, 500000, tzinfo=expected_tz)
         self.cursor.execute(
-            "SELECT CONVERT(DATETIMEOFFSET, '2024-03-20 14:15:30.5000000 +05:30')"
+            'SELECT CAST(:0 AS DATETIMEOFFSET)',
+            (expected,)
         )
         result = self.cursor.fetchone()[0]
-        
-        expected_tz = timezone(timedelta(hours=5, minutes=30))
-        expected = datetime(2024, 3, 20, 14, 15, 30, 500000, tzinfo=expected_tz)
+
         self.assertEqual(result, expected)
         self.assertEqual(result.utcoffset(), timedelta(hours=5, minutes=30))
 
     def test_datetimeoffset_negative_offset(self):
         """Test reading DATETIMEOFFSET with negative timezone offset."""
-        # Test -05:00 (Eastern Standard Time)
+        # Test -05:00 (Eastern Standard Time); the bound aware datetime
+        # round-trips in the binary DATETIMEOFFSET wire format.
+        expected_tz = timezone(timedelta(hours=-5))
+        expected = datetime(2024, 6, 10, 9, 45, 22, 789000, tzinfo=expected_tz)
         self.cursor.execute(
-            "SELECT CONVERT(DATETIMEOFFSET, '2024-06-10 09:45:22.7890000 -05:00')"
+            'SELECT CAST(:0 AS DATETIMEOFFSET)',
+            (expected,)
         )
         result = self.cursor.fetchone()[0]
-        
-        expected_tz = timezone(timedelta(hours=-5))
-        expected = datetime(2024, 6, 10, 9, 45, 22, 789000, tzinfo=expected_tz)
+
         self.assertEqual(result, expected)
         self.assertEqual(result.utcoffset(), timedelta(hours=-5))
 
     def test_datetimeoffset_various_offsets(self):
         """Test reading DATETIMEOFFSET with various timezone offsets."""
-        test_cases = [
-            # (SQL value, expected offset hours, expected offset minutes)
-            ('2024-01-01 00:00:00.0000000 +00:00', 0, 0),
-            ('2024-01-01 00:00:00.0000000 +01:00', 1, 0),
-            ('2024-01-01 00:00:00.0000000 -08:00', -8, 0),
-            ('2024-01-01 00:00:00.0000000 +09:30', 9, 30),
-            ('2024-01-01 00:00:00.0000000 -03:30', -3, -30),
-            ('2024-01-01 00:00:00.0000000 +12:00', 12, 0),
-            ('2024-01-01 00:00:00.0000000 -12:00', -12, 0),
-            ('2024-01-01 00:00:00.0000000 +14:00', 14, 0),
-        ]
-        
-        for sql_value, offset_hours, offset_minutes in test_cases:
+        # One parameterized UNION ALL batch returns every value in a
+        # single round-trip and lets the server reuse the compiled plan;
+        # the assertions then run without further DB I/O.
+        self.cursor.execute(
+            ' UNION ALL '.join(
+                'SELECT {0} AS i, CONVERT(DATETIMEOFFSET, :{0}) AS v'.format(ix)
+                for ix in range(len(_OFFSET_CASES))
+            ),
+            tuple(sql_value for sql_value, _ in _OFFSET_CASES)
+        )
+        results = {row.i: row.v for row in self.cursor.fetchall()}
+
+        for ix, (sql_value, offset) in enumerate(_OFFSET_CASES):
             with self.subTest(sql_value=sql_value):
-                self.cursor.execute(f"SELECT CONVERT(DATETIMEOFFSET, '{sql_value}')")
-                result = self.cursor.fetchone()[0]
-                
-                expected_offset = timedelta(hours=offset_hours, minutes=offset_minutes)
-                self.assertEqual(result.utcoffset(), expected_offset)
+                self.assertEqual(results[ix].utcoffset(), offset)
 
     def test_datetimeoffset_microsecond_precision(self):
         """Test reading DATETIMEOFFSET with various microsecond precisions."""
@@ -101,11 +152,21 @@ class TestDateTimeOffsetRead(TestExternalDatabase):
             ('2024-01-01 12:00:00.9999999 +00:00', 999999),
         ]
         
-        for sql_value, expected_microseconds in test_cases:
+        # One parameterized UNION ALL batch returns every value in a
+        # single round-trip and lets the server reuse the compiled plan;
+        # the assertions then run without further DB I/O.
+        self.cursor.execute(
+            ' UNION ALL '.join(
+                'SELECT {0} AS i, CONVERT(DATETIMEOFFSET, :{0}) AS v'.format(ix)
+                for ix in range(len(test_cases))
+            ),
+            tuple(sql_value for sql_value, _ in test_cases)
+        )
+        results = {row.i: row.v for row in self.cursor.fetchall()}
+
+        for ix, (sql_value, expected_microseconds) in enumerate(test_cases):
             with self.subTest(sql_value=sql_value):
-                self.cursor.execute(f"SELECT CONVERT(DATETIMEOFFSET, '{sql_value}')")
-                result = self.cursor.fetchone()[0]
-                self.assertEqual(result.microsecond, expected_microseconds)
+                self.assertEqual(results[ix].microsecond, expected_microseconds)
 
     def test_datetimeoffset_boundary_dates(self):
         """Test reading DATETIMEOFFSET with boundary date values."""
@@ -121,10 +182,21 @@ class TestDateTimeOffsetRead(TestExternalDatabase):
             '2024-04-30 23:59:59.9999999 +00:00',
         ]
         
-        for sql_value in test_cases:
+        # One parameterized UNION ALL batch returns every value in a
+        # single round-trip and lets the server reuse the compiled plan;
+        # the assertions then run without further DB I/O.
+        self.cursor.execute(
+            ' UNION ALL '.join(
+                'SELECT {0} AS i, CONVERT(DATETIMEOFFSET, :{0}) AS v'.format(ix)
+                for ix in range(len(test_cases))
+            ),
+            tuple(test_cases)
+        )
+        results = {row.i: row.v for row in self.cursor.fetchall()}
+
+        for ix, sql_value in enumerate(test_cases):
             with self.subTest(sql_value=sql_value):
-                self.cursor.execute(f"SELECT CONVERT(DATETIMEOFFSET, '{sql_value}')")
-                result = self.cursor.fetchone()[0]
+                result = results[ix]
                 self.assertIsInstance(result, datetime)
                 self.assertIsNotNone(result.tzinfo)
 
@@ -157,48 +229,31 @@ class TestDateTimeOffsetRead(TestExternalDatabase):
 
     def test_datetimeoffset_from_table(self):
         """Test reading DATETIMEOFFSET from a table column."""
-        # Create a temporary table
-        self.cursor.execute(
-            """
-            CREATE TABLE #test_dto (
-                id INT,
-                event_time DATETIMEOFFSET
-            )
-            """
-        )
-        
-        # Insert test data
+        # The table is created once in setUpClass. Reset, refill and
+        # read it in a single batch; the non-SELECT statements surface
+        # no result sets, so fetchall sees the SELECT directly.
         self.cursor.execute(
             """
+            TRUNCATE TABLE #test_dto;
             INSERT INTO #test_dto (id, event_time) VALUES
             (1, '2024-01-15 08:00:00.0000000 +00:00'),
             (2, '2024-01-15 08:00:00.0000000 +05:30'),
             (3, '2024-01-15 08:00:00.0000000 -08:00'),
-            (4, NULL)
+            (4, NULL);
+            SELECT id, event_time FROM #test_dto;
             """
         )
-        
-        # Read the data
-        self.cursor.execute("SELECT id, event_time FROM #test_dto ORDER BY id")
-        rows = self.cursor.fetchall()
-        
-        self.assertEqual(len(rows), 4)
-        
-        # Verify first row
-        self.assertEqual(rows[0].id, 1)
-        self.assertEqual(rows[0].event_time.utcoffset(), timedelta(0))
-        
-        # Verify second row
-        self.assertEqual(rows[1].id, 2)
-        self.assertEqual(rows[1].event_time.utcoffset(), timedelta(hours=5, minutes=30))
-        
-        # Verify third row
-        self.assertEqual(rows[2].id, 3)
-        self.assertEqual(rows[2].event_time.utcoffset(), timedelta(hours=-8))
-        
-        # Verify fourth row (NULL)
-        self.assertEqual(rows[3].id, 4)
-        self.assertIsNone(rows[3].event_time)
+        # Key by id rather than forcing a server-side sort; index the
+        # columns positionally since attribute access resolves the
+        # column name on every lookup.
+        by_id = {row[0]: row[1] for row in self.cursor.fetchall()}
+
+        self.assertEqual(len(by_id), 4)
+
+        self.assertEqual(by_id[1].utcoffset(), timedelta(0))
+        self.assertEqual(by_id[2].utcoffset(), timedelta(hours=5, minutes=30))
+        self.assertEqual(by_id[3].utcoffset(), timedelta(hours=-8))
+        self.assertIsNone(by_id[4])
 
     def test_datetimeoffset_switchoffset(self):
         """Test reading DATETIMEOFFSET after using SWITCHOFFSET function."""
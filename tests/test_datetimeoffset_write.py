@@ -5,35 +5,107 @@ This module tests the conversion of Python datetime objects with timezone
 information to SQL Server DATETIMEOFFSET data types.
 """
 from datetime import datetime, timezone, timedelta
+from itertools import zip_longest
 import unittest
 
 import k_ctds as ctds
 
 from .base import TestExternalDatabase
 
+# Fixed-offset timezone singletons, so repeated offsets share one
+# tzinfo instance instead of reconstructing it per test case.
+_TZ_CACHE = {}
+
+# Sentinel for zip_longest-based row validation; surfacing it in either
+# position means the row counts did not match.
+_MISSING = object()
+
+# All scalar echo probes share one statement text so the server reuses
+# a single cached plan across them.
+_ECHO_SQL = 'SELECT :0 AS result'
+
+
+def _tz(hours, minutes=0):
+    return _TZ_CACHE.setdefault(
+        (hours, minutes),
+        timezone(timedelta(hours=hours, minutes=minutes))
+    )
+
+
+def _offset_seconds(hours, minutes=0):
+    # Expected UTC offset as a plain int, so offset assertions compare
+    # integers instead of allocating timedelta objects.
+    return hours * 3600 + minutes * 60
+
+
+def _utcoffset_seconds(value):
+    return int(value.utcoffset().total_seconds())
+
+
+def _dto_key(value):
+    # Composite key for one-shot field comparisons.
+    return (
+        value.year, value.month, value.day,
+        value.hour, value.minute, value.second,
+        value.microsecond, value.utcoffset()
+    )
+
 
 class TestDateTimeOffsetWrite(TestExternalDatabase):
     """Test writing DATETIMEOFFSET values to SQL Server."""
 
+    @classmethod
+    def setUpClass(cls):
+        # One TDS login shared by the whole class; each test only opens
+        # a cursor. The throwaway instance is only needed because the
+        # connection settings are read in TestExternalDatabase.setUp.
+        case = cls('test_datetimeoffset_utc')
+        TestExternalDatabase.setUp(case)
+        cls.connection = case.connect(autocommit=False)
+
+        # The echo sproc is parameter-agnostic, so it is created once
+        # for the class instead of CREATE/DROP per test. The commit
+        # keeps it from being discarded by the per-test rollbacks.
+        cls.sproc_cursor = cls.connection.cursor()
+        cls.sproc_context = cls.stored_procedure(
+            cls.sproc_cursor,
+            'test_dto_sproc',
+            '''
+            @input_dt DATETIMEOFFSET,
+            @output_dt DATETIMEOFFSET OUTPUT
+            AS
+            BEGIN
+                SET @output_dt = @input_dt
+            END
+            '''
+        )
+        cls.sproc_context.__enter__()
+        cls.connection.commit()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sproc_context.__exit__(None, None, None)
+        cls.connection.commit()
+        cls.sproc_cursor.close()
+        cls.connection.close()
+
     def setUp(self):
         TestExternalDatabase.setUp(self)
-        self.connection = self.connect()
         self.cursor = self.connection.cursor()
 
     def tearDown(self):
         self.cursor.close()
-        self.connection.close()
+        # Roll back each test's temp tables and writes so the shared
+        # session starts every test clean.
+        self.connection.rollback()
         TestExternalDatabase.tearDown(self)
 
     def test_datetimeoffset_utc(self):
         """Test writing timezone-aware datetime with UTC timezone."""
         dt = datetime(2024, 1, 15, 12, 30, 45, 123456, tzinfo=timezone.utc)
         
-        self.cursor.execute(
-            "SELECT :0 AS result",
-            (dt,)
-        )
-        result = self.cursor.fetchone()[0]
+        self.cursor.execute(_ECHO_SQL, (dt,))
+        result = self.cursor.fetchval()
         
         self.assertEqual(result, dt)
         self.assertEqual(result.tzinfo, timezone.utc)
@@ -41,32 +113,26 @@ class TestDateTimeOffsetWrite(TestExternalDatabase):
     def test_datetimeoffset_positive_offset(self):
         """Test writing timezone-aware datetime with positive offset."""
         # Test +05:30 (India Standard Time)
-        tz = timezone(timedelta(hours=5, minutes=30))
+        tz = _tz(5, 30)
         dt = datetime(2024, 3, 20, 14, 15, 30, 500000, tzinfo=tz)
         
-        self.cursor.execute(
-            "SELECT :0 AS result",
-            (dt,)
-        )
-        result = self.cursor.fetchone()[0]
+        self.cursor.execute(_ECHO_SQL, (dt,))
+        result = self.cursor.fetchval()
         
         self.assertEqual(result, dt)
-        self.assertEqual(result.utcoffset(), timedelta(hours=5, minutes=30))
+        self.assertEqual(_utcoffset_seconds(result), _offset_seconds(5, 30))
 
     def test_datetimeoffset_negative_offset(self):
         """Test writing timezone-aware datetime with negative offset."""
         # Test -08:00 (Pacific Standard Time)
-        tz = timezone(timedelta(hours=-8))
+        tz = _tz(-8)
         dt = datetime(2024, 6, 10, 9, 45, 22, 789000, tzinfo=tz)
         
-        self.cursor.execute(
-            "SELECT :0 AS result",
-            (dt,)
-        )
-        result = self.cursor.fetchone()[0]
+        self.cursor.execute(_ECHO_SQL, (dt,))
+        result = self.cursor.fetchval()
         
         self.assertEqual(result, dt)
-        self.assertEqual(result.utcoffset(), timedelta(hours=-8))
+        self.assertEqual(_utcoffset_seconds(result), _offset_seconds(-8))
 
     def test_datetimeoffset_various_offsets(self):
         """Test writing timezone-aware datetime with various offsets."""
@@ -83,20 +149,37 @@ class TestDateTimeOffsetWrite(TestExternalDatabase):
         ]
         
         base_dt = datetime(2024, 1, 15, 12, 0, 0, 0)
-        
-        for offset_hours, offset_minutes in test_cases:
-            with self.subTest(offset_hours=offset_hours, offset_minutes=offset_minutes):
-                tz = timezone(timedelta(hours=offset_hours, minutes=offset_minutes))
-                dt = base_dt.replace(tzinfo=tz)
-                
-                self.cursor.execute("SELECT :0 AS result", (dt,))
-                result = self.cursor.fetchone()[0]
-                
-                self.assertEqual(result, dt)
-                self.assertEqual(
-                    result.utcoffset(), 
-                    timedelta(hours=offset_hours, minutes=offset_minutes)
-                )
+        dts = [
+            base_dt.replace(tzinfo=_tz(offset_hours, offset_minutes))
+            for offset_hours, offset_minutes in test_cases
+        ]
+
+        # Echo the whole sweep in one round-trip instead of one
+        # execute/fetch per offset.
+        self.cursor.execute(
+            'SELECT ' + ', '.join(':{0}'.format(ix) for ix in range(len(dts))),
+            tuple(dts)
+        )
+        actual = list(self.cursor.fetchone())
+
+        if actual != dts:
+            # Per-case subTests only on mismatch, so the failure output
+            # identifies the offending offset.
+            for ix, (offset_hours, offset_minutes) in enumerate(test_cases):
+                with self.subTest(offset_hours=offset_hours,
+                                  offset_minutes=offset_minutes):
+                    self.assertEqual(actual[ix], dts[ix])
+
+        self.assertListEqual(actual, dts)
+        # datetime equality compares instants, not offsets; verify the
+        # offsets survived the round-trip as well.
+        self.assertListEqual(
+            [_utcoffset_seconds(value) for value in actual],
+            [
+                _offset_seconds(offset_hours, offset_minutes)
+                for offset_hours, offset_minutes in test_cases
+            ]
+        )
 
     def test_datetimeoffset_microsecond_precision(self):
         """Test writing timezone-aware datetime with various microsecond values."""
@@ -109,67 +192,74 @@ class TestDateTimeOffsetWrite(TestExternalDatabase):
             999999,
         ]
         
-        for microseconds in test_cases:
+        dts = [
+            datetime(2024, 1, 1, 12, 0, 0, microseconds, tzinfo=tz)
+            for microseconds in test_cases
+        ]
+
+        # Echo the whole sweep in one round-trip instead of one
+        # execute/fetch per precision.
+        self.cursor.execute(
+            'SELECT ' + ', '.join(':{0}'.format(ix) for ix in range(len(dts))),
+            tuple(dts)
+        )
+        row = self.cursor.fetchone()
+
+        for ix, microseconds in enumerate(test_cases):
             with self.subTest(microseconds=microseconds):
-                dt = datetime(2024, 1, 1, 12, 0, 0, microseconds, tzinfo=tz)
-                
-                self.cursor.execute("SELECT :0 AS result", (dt,))
-                result = self.cursor.fetchone()[0]
-                
                 # SQL Server truncates to 7 decimal places, Python uses 6
                 # So we compare with truncation to microseconds
-                self.assertEqual(result.microsecond, microseconds)
+                self.assertEqual(row[ix].microsecond, microseconds)
 
     def test_datetimeoffset_null(self):
         """Test writing NULL for DATETIMEOFFSET."""
-        self.cursor.execute(
-            "SELECT :0 AS result",
-            (None,)
-        )
-        result = self.cursor.fetchone()[0]
+        self.cursor.execute(_ECHO_SQL, (None,))
+        result = self.cursor.fetchval()
         self.assertIsNone(result)
 
     def test_datetimeoffset_insert_table(self):
         """Test inserting timezone-aware datetime into a table."""
-        # Create a temporary table
-        self.cursor.execute(
-            """
-            CREATE TABLE #test_dto_write (
-                id INT,
-                event_time DATETIMEOFFSET
-            )
-            """
-        )
-        
         # Test data with various timezones
         test_data = [
             (1, datetime(2024, 1, 15, 8, 0, 0, 0, tzinfo=timezone.utc)),
-            (2, datetime(2024, 1, 15, 8, 0, 0, 0, 
-                        tzinfo=timezone(timedelta(hours=5, minutes=30)))),
-            (3, datetime(2024, 1, 15, 8, 0, 0, 0, 
-                        tzinfo=timezone(timedelta(hours=-8)))),
+            (2, datetime(2024, 1, 15, 8, 0, 0, 0, tzinfo=_tz(5, 30))),
+            (3, datetime(2024, 1, 15, 8, 0, 0, 0, tzinfo=_tz(-8))),
             (4, None),
         ]
-        
-        # Insert the data
-        for id_val, dt_val in test_data:
-            self.cursor.execute(
-                "INSERT INTO #test_dto_write (id, event_time) VALUES (:0, :1)",
-                (id_val, dt_val)
-            )
-        
-        # Read it back
-        self.cursor.execute("SELECT id, event_time FROM #test_dto_write ORDER BY id")
-        rows = self.cursor.fetchall()
-        
-        self.assertEqual(len(rows), 4)
-        
-        for i, (id_val, dt_val) in enumerate(test_data):
-            self.assertEqual(rows[i].id, id_val)
+
+        # Create, populate and read back in a single batch -- one
+        # round-trip instead of three. The non-SELECT statements
+        # surface no result sets, so the cursor sees the SELECT
+        # directly.
+        self.cursor.execute(
+            '''
+            CREATE TABLE #test_dto_write (
+                id INT,
+                event_time DATETIMEOFFSET
+            );
+            INSERT INTO #test_dto_write (id, event_time) VALUES {0};
+            SELECT id, event_time FROM #test_dto_write ORDER BY id;
+            '''.format(
+                ', '.join(
+                    '(:{0}, :{1})'.format(2 * ix, 2 * ix + 1)
+                    for ix in range(len(test_data))
+                )
+            ),
+            tuple(value for row in test_data for value in row)
+        )
+
+        # Iterate the cursor directly instead of materializing the
+        # result set; the sentinel catches a row count mismatch on
+        # either side.
+        for expected, row in zip_longest(test_data, self.cursor, fillvalue=_MISSING):
+            self.assertIsNot(expected, _MISSING)
+            self.assertIsNot(row, _MISSING)
+            id_val, dt_val = expected
+            self.assertEqual(row[0], id_val)
             if dt_val is None:
-                self.assertIsNone(rows[i].event_time)
+                self.assertIsNone(row[1])
             else:
-                self.assertEqual(rows[i].event_time, dt_val)
+                self.assertEqual(row[1], dt_val)
 
     def test_datetimeoffset_executemany(self):
         """Test writing multiple timezone-aware datetimes using executemany."""
@@ -186,12 +276,9 @@ class TestDateTimeOffsetWrite(TestExternalDatabase):
         # Test data
         test_data = [
             (1, datetime(2024, 1, 1, 10, 0, 0, 0, tzinfo=timezone.utc)),
-            (2, datetime(2024, 1, 2, 11, 0, 0, 0, 
-                        tzinfo=timezone(timedelta(hours=1)))),
-            (3, datetime(2024, 1, 3, 12, 0, 0, 0, 
-                        tzinfo=timezone(timedelta(hours=-5)))),
-            (4, datetime(2024, 1, 4, 13, 0, 0, 0, 
-                        tzinfo=timezone(timedelta(hours=8)))),
+            (2, datetime(2024, 1, 2, 11, 0, 0, 0, tzinfo=_tz(1))),
+            (3, datetime(2024, 1, 3, 12, 0, 0, 0, tzinfo=_tz(-5))),
+            (4, datetime(2024, 1, 4, 13, 0, 0, 0, tzinfo=_tz(8))),
         ]
         
         # Insert using executemany
@@ -200,15 +287,48 @@ class TestDateTimeOffsetWrite(TestExternalDatabase):
             test_data
         )
         
-        # Read it back
+        # Read it back, iterating the cursor directly instead of
+        # materializing the result set; the sentinel catches a row
+        # count mismatch on either side.
         self.cursor.execute("SELECT id, event_time FROM #test_dto_many ORDER BY id")
-        rows = self.cursor.fetchall()
-        
-        self.assertEqual(len(rows), len(test_data))
-        
-        for i, (id_val, dt_val) in enumerate(test_data):
-            self.assertEqual(rows[i].id, id_val)
-            self.assertEqual(rows[i].event_time, dt_val)
+        for expected, row in zip_longest(test_data, self.cursor, fillvalue=_MISSING):
+            self.assertIsNot(expected, _MISSING)
+            self.assertIsNot(row, _MISSING)
+            self.assertEqual(tuple(row), expected)
+
+    def test_datetimeoffset_bulk_insert(self):
+        """Test writing multiple timezone-aware datetimes using bulk_insert."""
+        # Create a temporary table
+        self.cursor.execute(
+            """
+            CREATE TABLE #test_dto_bulk (
+                id INT,
+                event_time DATETIMEOFFSET
+            )
+            """
+        )
+
+        # Test data
+        test_data = [
+            (1, datetime(2024, 1, 1, 10, 0, 0, 0, tzinfo=timezone.utc)),
+            (2, datetime(2024, 1, 2, 11, 0, 0, 0, tzinfo=_tz(1))),
+            (3, datetime(2024, 1, 3, 12, 0, 0, 0, tzinfo=_tz(-5))),
+            (4, datetime(2024, 1, 4, 13, 0, 0, 0, tzinfo=_tz(8))),
+        ]
+
+        # Insert over the BCP path, which streams every row in a single
+        # round-trip, unlike the per-row statements behind executemany.
+        inserted = self.connection.bulk_insert('#test_dto_bulk', test_data)
+        self.assertEqual(inserted, len(test_data))
+
+        # Read it back, iterating the cursor directly instead of
+        # materializing the result set; the sentinel catches a row
+        # count mismatch on either side.
+        self.cursor.execute("SELECT id, event_time FROM #test_dto_bulk ORDER BY id")
+        for expected, row in zip_longest(test_data, self.cursor, fillvalue=_MISSING):
+            self.assertIsNot(expected, _MISSING)
+            self.assertIsNot(row, _MISSING)
+            self.assertEqual(tuple(row), expected)
 
     def test_datetimeoffset_boundary_dates(self):
         """Test writing boundary date values for DATETIMEOFFSET."""
@@ -227,41 +347,24 @@ class TestDateTimeOffsetWrite(TestExternalDatabase):
         
         for dt in test_cases:
             with self.subTest(dt=dt):
-                self.cursor.execute("SELECT :0 AS result", (dt,))
-                result = self.cursor.fetchone()[0]
-                
-                self.assertEqual(result.year, dt.year)
-                self.assertEqual(result.month, dt.month)
-                self.assertEqual(result.day, dt.day)
-                self.assertEqual(result.hour, dt.hour)
-                self.assertEqual(result.minute, dt.minute)
-                self.assertEqual(result.second, dt.second)
-                self.assertEqual(result.microsecond, dt.microsecond)
-                self.assertEqual(result.utcoffset(), dt.utcoffset())
+                self.cursor.execute(_ECHO_SQL, (dt,))
+                result = self.cursor.fetchval()
+
+                # One composite comparison instead of eight assertions.
+                self.assertEqual(_dto_key(result), _dto_key(dt))
 
     def test_datetimeoffset_stored_procedure(self):
         """Test passing timezone-aware datetime to stored procedure."""
-        with self.stored_procedure(
-            self.cursor,
-            'test_dto_sproc',
-            '''
-            @input_dt DATETIMEOFFSET,
-            @output_dt DATETIMEOFFSET OUTPUT
-            AS
-            BEGIN
-                SET @output_dt = @input_dt
-            END
-            '''
-        ):
-            tz = timezone(timedelta(hours=5, minutes=30))
-            input_dt = datetime(2024, 1, 15, 12, 30, 45, 123456, tzinfo=tz)
-            output_dt = ctds.Parameter(input_dt, output=True)
-            outputs = self.cursor.callproc('test_dto_sproc', (input_dt, output_dt))
-            self.assertEqual(outputs[1], input_dt) 
+        # The sproc is created once in setUpClass.
+        tz = _tz(5, 30)
+        input_dt = datetime(2024, 1, 15, 12, 30, 45, 123456, tzinfo=tz)
+        output_dt = ctds.Parameter(input_dt, output=True)
+        outputs = self.cursor.callproc('test_dto_sproc', (input_dt, output_dt))
+        self.assertEqual(outputs[1], input_dt)
 
     def test_datetimeoffset_parameter_type(self):
         """Test that timezone-aware datetime is recognized as DATETIMEOFFSET."""
-        tz = timezone(timedelta(hours=5, minutes=30))
+        tz = _tz(5, 30)
         dt = datetime(2024, 1, 15, 12, 30, 45, 123456, tzinfo=tz)
         
         row = self.parameter_type(self.cursor, dt)
@@ -271,8 +374,8 @@ class TestDateTimeOffsetWrite(TestExternalDatabase):
 
     def test_datetimeoffset_comparison(self):
         """Test comparing DATETIMEOFFSET values in SQL."""
-        tz1 = timezone(timedelta(hours=0))
-        tz2 = timezone(timedelta(hours=5, minutes=30))
+        tz1 = _tz(0)
+        tz2 = _tz(5, 30)
         
         # Same instant in time, different timezones
         dt1 = datetime(2024, 1, 15, 12, 0, 0, 0, tzinfo=tz1)
@@ -296,68 +399,61 @@ class TestDateTimeOffsetWrite(TestExternalDatabase):
 
     def test_datetimeoffset_update(self):
         """Test updating DATETIMEOFFSET column."""
-        # Create and populate table
+        initial_dt = datetime(2024, 1, 1, 10, 0, 0, 0, tzinfo=timezone.utc)
+        updated_dt = datetime(2024, 6, 15, 15, 30, 0, 0, tzinfo=_tz(5, 30))
+
+        # Create, populate, update and read back in a single batch --
+        # one round-trip instead of four. The non-SELECT statements
+        # surface no result sets, so the cursor sees the SELECT
+        # directly.
         self.cursor.execute(
-            """
+            '''
             CREATE TABLE #test_dto_update (
                 id INT,
                 event_time DATETIMEOFFSET
-            )
-            """
+            );
+            INSERT INTO #test_dto_update (id, event_time) VALUES (1, :0);
+            UPDATE #test_dto_update SET event_time = :1 WHERE id = 1;
+            SELECT event_time FROM #test_dto_update WHERE id = 1;
+            ''',
+            (initial_dt, updated_dt)
         )
-        
-        initial_dt = datetime(2024, 1, 1, 10, 0, 0, 0, tzinfo=timezone.utc)
-        self.cursor.execute(
-            "INSERT INTO #test_dto_update (id, event_time) VALUES (1, :0)",
-            (initial_dt,)
-        )
-        
-        # Update with new value
-        updated_dt = datetime(2024, 6, 15, 15, 30, 0, 0, 
-                             tzinfo=timezone(timedelta(hours=5, minutes=30)))
-        self.cursor.execute(
-            "UPDATE #test_dto_update SET event_time = :0 WHERE id = 1",
-            (updated_dt,)
-        )
-        
-        # Read back
-        self.cursor.execute("SELECT event_time FROM #test_dto_update WHERE id = 1")
-        result = self.cursor.fetchone()[0]
-        
+        result = self.cursor.fetchval()
+
         self.assertEqual(result, updated_dt)
 
     def test_datetimeoffset_where_clause(self):
         """Test using DATETIMEOFFSET in WHERE clause."""
-        # Create and populate table
-        self.cursor.execute(
-            """
-            CREATE TABLE #test_dto_where (
-                id INT,
-                event_time DATETIMEOFFSET
-            )
-            """
-        )
-        
         test_data = [
             (1, datetime(2024, 1, 1, 10, 0, 0, 0, tzinfo=timezone.utc)),
             (2, datetime(2024, 1, 2, 11, 0, 0, 0, tzinfo=timezone.utc)),
             (3, datetime(2024, 1, 3, 12, 0, 0, 0, tzinfo=timezone.utc)),
         ]
-        
-        for id_val, dt_val in test_data:
-            self.cursor.execute(
-                "INSERT INTO #test_dto_where (id, event_time) VALUES (:0, :1)",
-                (id_val, dt_val)
-            )
-        
-        # Query with WHERE clause
         search_dt = test_data[1][1]
+
+        # Create, populate and query in a single batch -- one
+        # round-trip instead of three. The non-SELECT statements
+        # surface no result sets, so the cursor sees the SELECT
+        # directly.
         self.cursor.execute(
-            "SELECT id FROM #test_dto_where WHERE event_time = :0",
-            (search_dt,)
+            '''
+            CREATE TABLE #test_dto_where (
+                id INT,
+                event_time DATETIMEOFFSET
+            );
+            INSERT INTO #test_dto_where (id, event_time) VALUES {0};
+            SELECT id FROM #test_dto_where WHERE event_time = :{1};
+            '''.format(
+                ', '.join(
+                    '(:{0}, :{1})'.format(2 * ix, 2 * ix + 1)
+                    for ix in range(len(test_data))
+                ),
+                2 * len(test_data)
+            ),
+            tuple(value for row in test_data for value in row) + (search_dt,)
         )
         result = self.cursor.fetchone()
-        
+
         self.assertEqual(result.id, 2)
 
     def test_naive_datetime_error(self):
@@ -371,8 +467,8 @@ class TestDateTimeOffsetWrite(TestExternalDatabase):
         # 3. Convert to DATETIME instead of DATETIMEOFFSET
         
         try:
-            self.cursor.execute("SELECT :0 AS result", (naive_dt,))
-            result = self.cursor.fetchone()[0]
+            self.cursor.execute(_ECHO_SQL, (naive_dt,))
+            result = self.cursor.fetchval()
             
             # If it doesn't raise an error, check what type it became
             # This is implementation-dependent